@@ -3,3 +3,10 @@ from .product_admin import ProductAdmin
 from .sales_data_admin import SalesDataAdmin
 from .user_engagement_admin import UserEngagementAdmin
 from .customer_feedback_admin import CustomerFeedbackAdmin
+from .product_forecast_admin import ProductForecastAdmin
+from .metric_anomaly_admin import MetricAnomalyAdmin
+from .metric_job_admin import MetricJobAdmin
+from .sales_channel_admin import SalesChannelAdmin
+from .region_admin import RegionAdmin
+from .customer_segment_admin import CustomerSegmentAdmin
+from .product_access_grant_admin import ProductAccessGrantAdmin
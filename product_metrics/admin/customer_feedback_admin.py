@@ -3,11 +3,12 @@ from django.utils.translation import gettext_lazy as _
 from django.utils.html import format_html
 from product_metrics.models import CustomerFeedback
 from product_metrics.mixins.admin.base import BaseModelAdmin
+from product_metrics.mixins.admin.permission import ProductAccessControlMixin
 from product_metrics.settings.conf import config
 
 
 @admin.register(CustomerFeedback, site=config.admin_site_class)
-class CustomerFeedbackAdmin(BaseModelAdmin):
+class CustomerFeedbackAdmin(ProductAccessControlMixin, BaseModelAdmin):
     list_display = ("product", "date", "rating", "rating_stars", "feedback_preview")
     autocomplete_fields = ("product",)
     search_fields = ("product__name", "date", "feedback")
@@ -0,0 +1,56 @@
+from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+from django.utils.html import format_html
+from product_metrics.models import MetricAnomaly
+from product_metrics.mixins.admin.base import BaseModelAdmin
+from product_metrics.mixins.admin.permission import ProductAccessControlMixin
+from product_metrics.settings.conf import config
+
+
+@admin.register(MetricAnomaly, site=config.admin_site_class)
+class MetricAnomalyAdmin(ProductAccessControlMixin, BaseModelAdmin):
+    list_display = (
+        "product",
+        "metric",
+        "date",
+        "value",
+        "expected",
+        "z_score_display",
+        "severity_color",
+    )
+    autocomplete_fields = ("product",)
+    search_fields = ("product__name", "metric", "date")
+    list_filter = ("severity", "metric", "product", "date")
+    date_hierarchy = "date"
+    ordering = ("-date",)
+    readonly_fields = ("detected_at",)
+    fieldsets = (
+        (
+            None,
+            {
+                "fields": (
+                    "product",
+                    "metric",
+                    "date",
+                    "value",
+                    "expected",
+                    "z_score",
+                    "severity",
+                )
+            },
+        ),
+        (_("Timestamps"), {"fields": ("detected_at",), "classes": ("collapse",)}),
+    )
+
+    def z_score_display(self, obj):
+        return f"{obj.z_score:+.2f}"
+
+    z_score_display.short_description = _("Z-Score")
+
+    def severity_color(self, obj):
+        color = "red" if obj.severity == MetricAnomaly.Severity.CRITICAL else "orange"
+        return format_html(
+            '<span style="color: {};">{}</span>', color, obj.get_severity_display()
+        )
+
+    severity_color.short_description = _("Severity")
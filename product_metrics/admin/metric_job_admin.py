@@ -0,0 +1,83 @@
+from django.contrib import admin
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from django.utils.html import format_html
+from product_metrics.models import MetricJob
+from product_metrics.mixins.admin.base import BaseModelAdmin
+from product_metrics.settings.conf import config
+
+
+@admin.register(MetricJob, site=config.admin_site_class)
+class MetricJobAdmin(BaseModelAdmin):
+    list_display = (
+        "task",
+        "key",
+        "status_color",
+        "attempts",
+        "run_after",
+        "duration_display",
+        "total_duration_display",
+        "worker",
+    )
+    search_fields = ("task", "key", "worker")
+    list_filter = ("status", "task", "created_at")
+    date_hierarchy = "created_at"
+    ordering = ("-created_at",)
+    actions = ["retry_jobs"]
+    fieldsets = (
+        (None, {"fields": ("key", "task", "payload", "status")}),
+        (_("Scheduling"), {"fields": ("attempts", "max_attempts", "run_after", "worker")}),
+        (
+            _("Timing"),
+            {
+                "fields": (
+                    "started_at",
+                    "heartbeat_at",
+                    "finished_at",
+                    "duration",
+                    "total_duration",
+                )
+            },
+        ),
+        (_("Errors"), {"fields": ("last_error",), "classes": ("collapse",)}),
+    )
+    readonly_fields = (
+        "started_at",
+        "heartbeat_at",
+        "finished_at",
+        "duration",
+        "total_duration",
+        "last_error",
+        "created_at",
+    )
+
+    def status_color(self, obj):
+        color = {
+            MetricJob.Status.SUCCEEDED: "green",
+            MetricJob.Status.FAILED: "red",
+            MetricJob.Status.RUNNING: "blue",
+        }.get(obj.status, "orange")
+        return format_html(
+            '<span style="color: {};">{}</span>', color, obj.get_status_display()
+        )
+
+    status_color.short_description = _("Status")
+
+    def duration_display(self, obj):
+        if obj.duration is None:
+            return "-"
+        return f"{obj.duration:.2f}s"
+
+    duration_display.short_description = _("Last Duration")
+
+    def total_duration_display(self, obj):
+        return f"{obj.total_duration:.2f}s"
+
+    total_duration_display.short_description = _("Total Duration")
+
+    def retry_jobs(self, request, queryset):
+        queryset.exclude(status=MetricJob.Status.RUNNING).update(
+            status=MetricJob.Status.PENDING, attempts=0, run_after=timezone.now()
+        )
+
+    retry_jobs.short_description = _("Retry selected jobs")
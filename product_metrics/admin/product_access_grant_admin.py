@@ -0,0 +1,19 @@
+from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+from product_metrics.models import ProductAccessGrant
+from product_metrics.mixins.admin.base import BaseModelAdmin
+from product_metrics.mixins.admin.permission import ProductAccessControlMixin
+from product_metrics.settings.conf import config
+
+
+@admin.register(ProductAccessGrant, site=config.admin_site_class)
+class ProductAccessGrantAdmin(ProductAccessControlMixin, BaseModelAdmin):
+    list_display = ("product", "user", "group", "created_at")
+    autocomplete_fields = ("product", "user", "group")
+    search_fields = ("product__name", "user__username", "group__name")
+    list_filter = ("product", "group")
+    readonly_fields = ("created_at",)
+    fieldsets = (
+        (None, {"fields": ("product", "user", "group")}),
+        (_("Timestamps"), {"fields": ("created_at",), "classes": ("collapse",)}),
+    )
@@ -0,0 +1,25 @@
+from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+from product_metrics.models import ProductForecast
+from product_metrics.mixins.admin.base import BaseModelAdmin
+from product_metrics.mixins.admin.permission import ProductAccessControlMixin
+from product_metrics.settings.conf import config
+
+
+@admin.register(ProductForecast, site=config.admin_site_class)
+class ProductForecastAdmin(ProductAccessControlMixin, BaseModelAdmin):
+    list_display = ("product", "metric", "date", "forecast_value", "origin_date")
+    autocomplete_fields = ("product",)
+    search_fields = ("product__name", "date")
+    list_filter = ("metric", "product", "origin_date")
+    date_hierarchy = "date"
+    readonly_fields = ("created_at",)
+    fieldsets = (
+        (None, {"fields": ("product", "metric", "date", "value", "origin_date")}),
+        (_("Timestamps"), {"fields": ("created_at",), "classes": ("collapse",)}),
+    )
+
+    def forecast_value(self, obj):
+        return f"{obj.value:,.2f}"
+
+    forecast_value.short_description = _("Value")
@@ -0,0 +1,12 @@
+from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+from product_metrics.models import Region
+from product_metrics.mixins.admin.base import BaseModelAdmin
+from product_metrics.settings.conf import config
+
+
+@admin.register(Region, site=config.admin_site_class)
+class RegionAdmin(BaseModelAdmin):
+    list_display = ("name", "description")
+    search_fields = ("name", "description")
+    ordering = ("name",)
@@ -2,18 +2,20 @@ from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
 from product_metrics.models import SalesData
 from product_metrics.mixins.admin.base import BaseModelAdmin
+from product_metrics.mixins.admin.permission import ProductAccessControlMixin
 from product_metrics.settings.conf import config
 
 
 @admin.register(SalesData, site=config.admin_site_class)
-class SalesDataAdmin(BaseModelAdmin):
+class SalesDataAdmin(ProductAccessControlMixin, BaseModelAdmin):
     list_display = ("product", "date", "units_sold", "revenue", "revenue_per_unit")
-    autocomplete_fields = ("product", "currency")
+    autocomplete_fields = ("product", "currency", "channel", "region", "segment")
     search_fields = ("product__name", "date")
-    list_filter = ("product", "date", "currency")
+    list_filter = ("product", "date", "currency", "channel", "region", "segment")
     date_hierarchy = "date"
     fieldsets = (
         (None, {"fields": ("product", "date", "units_sold", "revenue", "currency")}),
+        (_("Dimensions"), {"fields": ("channel", "region", "segment")}),
     )
 
     def revenue_per_unit(self, obj):
@@ -3,17 +3,21 @@ from django.utils.translation import gettext_lazy as _
 from django.utils.html import format_html
 from product_metrics.models import UserEngagement
 from product_metrics.mixins.admin.base import BaseModelAdmin
+from product_metrics.mixins.admin.permission import ProductAccessControlMixin
 from product_metrics.settings.conf import config
 
 
 @admin.register(UserEngagement, site=config.admin_site_class)
-class UserEngagementAdmin(BaseModelAdmin):
+class UserEngagementAdmin(ProductAccessControlMixin, BaseModelAdmin):
     list_display = ("product", "date", "active_users", "churn_rate_color")
-    autocomplete_fields = ("product",)
+    autocomplete_fields = ("product", "channel", "region", "segment")
     search_fields = ("product__name", "date")
-    list_filter = ("product", "date")
+    list_filter = ("product", "date", "channel", "region", "segment")
     date_hierarchy = "date"
-    fieldsets = ((None, {"fields": ("product", "date", "active_users", "churn_rate")}),)
+    fieldsets = (
+        (None, {"fields": ("product", "date", "active_users", "churn_rate")}),
+        (_("Dimensions"), {"fields": ("channel", "region", "segment")}),
+    )
 
     def churn_rate_color(self, obj):
         if obj.churn_rate > 10:
@@ -0,0 +1,208 @@
+"""Incremental anomaly detection over daily product metrics.
+
+Each scan reads only the metric days newer than the watermark stored for
+its source, folds them into exponentially weighted running statistics per
+product and metric, and records the days that deviate from those
+statistics. The cost of a run therefore grows with the amount of new data
+rather than with the total history.
+
+Rows may arrive late or be corrected for days the watermark has already
+passed, so every scan also rescores the last `RESCAN_DAYS` days up to the
+watermark against the current statistics, without folding them in again.
+"""
+
+import math
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Avg, Count, Sum
+from django.utils import timezone
+
+from product_metrics.measures import CHURN_RATE, REVENUE
+from product_metrics.models import (
+    CustomerFeedback,
+    MetricAnomaly,
+    MetricBaseline,
+    MetricWatermark,
+    SalesData,
+    UserEngagement,
+)
+
+EWMA_ALPHA = 0.1
+WARMUP_OBSERVATIONS = 7
+WARNING_THRESHOLD = 3.0
+CRITICAL_THRESHOLD = 5.0
+RESCAN_DAYS = 7
+
+ANOMALY_SOURCES = {
+    "sales_data": (
+        SalesData,
+        {"revenue": REVENUE, "units_sold": Sum("units_sold")},
+    ),
+    "user_engagement": (
+        UserEngagement,
+        {"churn_rate": CHURN_RATE, "active_users": Sum("active_users")},
+    ),
+    "customer_feedback": (
+        CustomerFeedback,
+        {"average_rating": Avg("rating"), "feedback_count": Count("id")},
+    ),
+}
+
+
+def _score(baseline, value):
+    """Return the z-score of a value against a baseline.
+
+    Returns:
+        float or None: The z-score of the value, or None while the baseline
+        is still warming up or has no variance.
+
+    """
+    deviation = math.sqrt(baseline.variance)
+    if baseline.observations >= WARMUP_OBSERVATIONS and deviation > 0:
+        return (value - baseline.mean) / deviation
+    return None
+
+
+def _observe(baseline, value):
+    """Score a value against a baseline and fold it into the statistics.
+
+    Args:
+        baseline: The `MetricBaseline` of the value's product and metric.
+        value: The observed daily value.
+
+    Returns:
+        float or None: The z-score of the value, as returned by `_score`.
+
+    """
+    z_score = _score(baseline, value)
+    if baseline.observations:
+        diff = value - baseline.mean
+        increment = EWMA_ALPHA * diff
+        baseline.mean += increment
+        baseline.variance = (1 - EWMA_ALPHA) * (baseline.variance + diff * increment)
+    else:
+        baseline.mean = value
+    baseline.observations += 1
+    return z_score
+
+
+def _severity(z_score):
+    """Return the `MetricAnomaly.Severity` of a z-score, or None if normal."""
+    if z_score is None or abs(z_score) < WARNING_THRESHOLD:
+        return None
+    if abs(z_score) >= CRITICAL_THRESHOLD:
+        return MetricAnomaly.Severity.CRITICAL
+    return MetricAnomaly.Severity.WARNING
+
+
+def scan_source(source, until):
+    """Scan the new metric days of a single source for anomalies.
+
+    The last `RESCAN_DAYS` days up to the watermark are scored again, so
+    anomalies of late or corrected rows are recorded too; days that already
+    have an anomaly of the same metric are left unchanged.
+
+    Args:
+        source: A key of `ANOMALY_SOURCES`.
+        until: The last metric date to include in the scan.
+
+    Returns:
+        int: The number of recorded anomalies.
+
+    """
+    model, aggregates = ANOMALY_SOURCES[source]
+    key = f"anomalies:{source}"
+    MetricWatermark.objects.get_or_create(key=key)
+
+    with transaction.atomic():
+        watermark = MetricWatermark.objects.select_for_update().get(key=key)
+        rows = model.objects.filter(date__lte=until)
+        if watermark.last_date:
+            rows = rows.filter(
+                date__gt=watermark.last_date - timedelta(days=RESCAN_DAYS)
+            )
+        rows = list(
+            rows.values("product_id", "date").annotate(**aggregates).order_by("date")
+        )
+        if not rows:
+            return 0
+
+        baselines = {
+            (baseline.product_id, baseline.metric): baseline
+            for baseline in MetricBaseline.objects.filter(
+                product_id__in={row["product_id"] for row in rows},
+                metric__in=list(aggregates),
+            )
+        }
+        existing = set(baselines)
+        anomalies = []
+
+        for row in rows:
+            rescanned = watermark.last_date and row["date"] <= watermark.last_date
+            for metric in aggregates:
+                if row[metric] is None:
+                    continue
+                value = float(row[metric])
+                if rescanned:
+                    # Already folded into the statistics, so only rescore it
+                    baseline = baselines.get((row["product_id"], metric))
+                    if baseline is None:
+                        continue
+                    expected = baseline.mean
+                    z_score = _score(baseline, value)
+                else:
+                    baseline = baselines.setdefault(
+                        (row["product_id"], metric),
+                        MetricBaseline(product_id=row["product_id"], metric=metric),
+                    )
+                    expected = baseline.mean
+                    z_score = _observe(baseline, value)
+                    baseline.last_date = row["date"]
+                severity = _severity(z_score)
+                if severity:
+                    anomalies.append(
+                        MetricAnomaly(
+                            product_id=row["product_id"],
+                            metric=metric,
+                            date=row["date"],
+                            value=value,
+                            expected=expected,
+                            z_score=z_score,
+                            severity=severity,
+                        )
+                    )
+
+        MetricBaseline.objects.bulk_update(
+            [baselines[key] for key in existing],
+            ["mean", "variance", "observations", "last_date"],
+            batch_size=1000,
+        )
+        MetricBaseline.objects.bulk_create(
+            [baseline for key, baseline in baselines.items() if key not in existing],
+            batch_size=1000,
+        )
+        MetricAnomaly.objects.bulk_create(
+            anomalies, batch_size=1000, ignore_conflicts=True
+        )
+        watermark.last_date = max(
+            filter(None, (watermark.last_date, rows[-1]["date"]))
+        )
+        watermark.save(update_fields=["last_date", "updated_at"])
+
+    return len(anomalies)
+
+
+def scan_anomalies(until=None):
+    """Scan every anomaly source for metric days newer than its watermark.
+
+    Args:
+        until: The last metric date to include. Defaults to yesterday so
+            that only complete days are folded into the statistics.
+
+    Returns:
+        dict: The number of recorded anomalies per source.
+
+    """
+    until = until or timezone.localdate() - timedelta(days=1)
+    return {source: scan_source(source, until) for source in ANOMALY_SOURCES}
@@ -0,0 +1,137 @@
+"""Approximate aggregates over large metric tables.
+
+Sampled models carry an indexed `sample_key` drawn uniformly from [0, 1)
+when a row is created. Filtering on `sample_key < fraction` therefore
+selects a Bernoulli sample of the requested fraction through an index
+range scan, on any database. Aggregates over such a sample are scaled back
+to the full table and returned with a normal-approximation confidence
+interval.
+"""
+
+import math
+from typing import NamedTuple
+
+from django.db.models import Count, F, FloatField, Sum
+from django.db.models.functions import Cast, Random
+
+from product_metrics.models import CustomerFeedback, SalesData
+
+SAMPLED_MODELS = (SalesData, CustomerFeedback)
+DEFAULT_SAMPLE_FRACTION = 0.1
+MIN_SAMPLE_FRACTION = 0.001
+CONFIDENCE_Z = 1.96
+
+
+class Estimate(NamedTuple):
+    """An aggregate value with the bounds of its 95% confidence interval.
+
+    Exact values have equal bounds and a `sample_size` equal to the number
+    of rows aggregated.
+
+    """
+
+    value: float
+    lower: float
+    upper: float
+    sample_size: int
+
+    @property
+    def margin(self):
+        """Return the half-width of the confidence interval."""
+        return (self.upper - self.lower) / 2
+
+    @property
+    def is_exact(self):
+        """Return whether the estimate has no sampling error."""
+        return self.lower == self.upper
+
+
+def sample(queryset, fraction):
+    """Restrict a queryset of a sampled model to a uniform sample.
+
+    Args:
+        queryset: A queryset of one of `SAMPLED_MODELS`.
+        fraction: The sampling fraction; 1 or more returns the queryset
+            unchanged.
+
+    """
+    if fraction >= 1:
+        return queryset
+    return queryset.filter(sample_key__lt=fraction)
+
+
+def _interval(value, variance, sample_size):
+    """Build an `Estimate` from a point estimate and its variance."""
+    margin = CONFIDENCE_Z * math.sqrt(max(variance, 0))
+    return Estimate(value, value - margin, value + margin, sample_size)
+
+
+def _estimates(row, fraction):
+    """Scale the raw sample aggregates of `row` to the full population.
+
+    The count and the sum use the Horvitz-Thompson estimator of a
+    Bernoulli sample, the mean uses the sample mean with a finite
+    population correction.
+
+    """
+    fraction = min(fraction, 1)
+    n = row["sample_size"] or 0
+    total = float(row["sample_total"] or 0)
+    squares = float(row.get("sample_squares") or 0)
+    correction = 1 - fraction
+
+    mean = total / n if n else 0.0
+    sample_variance = (squares - n * mean**2) / (n - 1) if n > 1 else 0.0
+    return {
+        "count": _interval(n / fraction, n * correction / fraction**2, n),
+        "sum": _interval(total / fraction, squares * correction / fraction**2, n),
+        "avg": _interval(
+            mean, correction * sample_variance / n if n else 0.0, n
+        ),
+    }
+
+
+def approximate_aggregate(queryset, field, fraction=DEFAULT_SAMPLE_FRACTION, group_by=None):
+    """Estimate the count, sum and average of a field from a uniform sample.
+
+    Args:
+        queryset: A queryset of one of `SAMPLED_MODELS`.
+        field: The numeric field to aggregate.
+        fraction: The sampling fraction; 1 or more computes exact values.
+        group_by: An optional field to estimate the aggregates per value of.
+
+    Returns:
+        dict: The `count`, `sum` and `avg` estimates, or a mapping of each
+        `group_by` value to such a dict when grouping.
+
+    """
+    aggregates = {"sample_size": Count("pk"), "sample_total": Sum(field)}
+    if fraction < 1:
+        # Squares are only needed for the sampling variance and are summed
+        # as floats, since they overflow the integer type of the field
+        value = Cast(F(field), FloatField())
+        aggregates["sample_squares"] = Sum(value * value)
+    sampled = sample(queryset, fraction)
+    if group_by is None:
+        return _estimates(sampled.aggregate(**aggregates), fraction)
+    return {
+        row[group_by]: _estimates(row, fraction)
+        for row in sampled.values(group_by).annotate(**aggregates).order_by()
+    }
+
+
+def reset_sample_keys():
+    """Redraw the sample keys of every row of the sampled models.
+
+    Rows added by a schema migration all share the key evaluated once for
+    the column default, so the keys must be redrawn once after the column
+    is added for the samples to be uniform.
+
+    Returns:
+        dict: The number of updated rows per model label.
+
+    """
+    return {
+        model._meta.label: model.objects.update(sample_key=Random())
+        for model in SAMPLED_MODELS
+    }
@@ -6,4 +6,6 @@ class ProductMetricsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "product_metrics"
     verbose_name = _("Django Product Metrics")
-    
+
+    def ready(self):
+        from product_metrics import signals, tasks  # noqa: F401
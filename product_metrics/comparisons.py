@@ -0,0 +1,134 @@
+"""Period-over-period comparisons of the latest product KPIs.
+
+For each metric family the latest metric date of every requested product
+is resolved with one grouped query, and the values of both the latest and
+the comparison dates are then fetched together with a second query, so the
+cost does not depend on the number of products.
+"""
+
+import calendar
+from datetime import timedelta
+
+from django.db.models import Avg, Max, Sum
+
+from product_metrics.measures import CHURN_RATE, REVENUE
+from product_metrics.models import CustomerFeedback, SalesData, UserEngagement
+
+COMPARISON_PERIODS = ("day", "week", "month", "year")
+DEFAULT_COMPARISON_PERIOD = "day"
+
+KPI_FAMILIES = {
+    "sales_data": (
+        SalesData,
+        {"revenue": REVENUE, "units_sold": Sum("units_sold")},
+    ),
+    "user_engagement": (
+        UserEngagement,
+        {"churn_rate": CHURN_RATE, "active_users": Sum("active_users")},
+    ),
+    "customer_feedback": (
+        CustomerFeedback,
+        {"average_rating": Avg("rating")},
+    ),
+}
+
+
+def comparison_date(day, period):
+    """Return the date `day` is compared against for the given period.
+
+    Months and years are calendar based: the same day of the previous month
+    or year, clamped to the last day of that month.
+
+    Args:
+        day: The date being compared.
+        period: One of `COMPARISON_PERIODS`.
+
+    Raises:
+        ValueError: If `period` is not a known comparison period.
+
+    """
+    if period == "day":
+        return day - timedelta(days=1)
+    if period == "week":
+        return day - timedelta(weeks=1)
+    if period not in COMPARISON_PERIODS:
+        raise ValueError(f"Unknown comparison period: {period!r}.")
+
+    months = 1 if period == "month" else 12
+    year, month = divmod(day.year * 12 + day.month - 1 - months, 12)
+    month += 1
+    return day.replace(
+        year=year, month=month, day=min(day.day, calendar.monthrange(year, month)[1])
+    )
+
+
+def _compare(value, previous):
+    """Return the absolute and relative change between two values."""
+    if value is None or previous is None:
+        return None, None
+    delta = value - previous
+    return delta, (delta / previous * 100 if previous else None)
+
+
+def fetch_kpi_comparisons(product_ids, period=DEFAULT_COMPARISON_PERIOD):
+    """Return the latest KPI values of products compared to a prior period.
+
+    Args:
+        product_ids: The ids of the products to compare.
+        period: One of `COMPARISON_PERIODS`.
+
+    Returns:
+        dict: A mapping of product id to a mapping of metric name to a dict
+        with the `date`, `value`, `previous_date`, `previous`, `delta` and
+        `delta_percent` of the metric. Metrics of families without data for
+        the product are omitted.
+
+    """
+    comparisons = {product_id: {} for product_id in product_ids}
+    for model, aggregates in KPI_FAMILIES.values():
+        latest_dates = dict(
+            model.objects.filter(product_id__in=product_ids)
+            .values_list("product_id")
+            .annotate(latest_date=Max("date"))
+            .order_by()
+        )
+        if not latest_dates:
+            continue
+        previous_dates = {
+            product_id: comparison_date(latest_date, period)
+            for product_id, latest_date in latest_dates.items()
+        }
+
+        rows = (
+            model.objects.filter(
+                product_id__in=latest_dates,
+                date__in={*latest_dates.values(), *previous_dates.values()},
+            )
+            .values("product_id", "date")
+            .annotate(**aggregates)
+            .order_by()
+        )
+        values = {
+            (row["product_id"], row["date"]): {
+                metric: None if row[metric] is None else float(row[metric])
+                for metric in aggregates
+            }
+            for row in rows
+        }
+
+        for product_id, latest_date in latest_dates.items():
+            previous_date = previous_dates[product_id]
+            current = values.get((product_id, latest_date), {})
+            previous = values.get((product_id, previous_date), {})
+            for metric in aggregates:
+                delta, delta_percent = _compare(current.get(metric), previous.get(metric))
+                comparisons[product_id][metric] = {
+                    "date": latest_date,
+                    "value": current.get(metric),
+                    "previous_date": previous_date,
+                    "previous": previous.get(metric),
+                    "delta": delta,
+                    "delta_percent": delta_percent,
+                }
+
+    return comparisons
@@ -0,0 +1,268 @@
+"""Dimensional breakdowns of sales and engagement metrics.
+
+The cube materializes the daily totals of every product for a chosen set
+of dimension combinations (groupings). A breakdown is answered from the
+smallest materialized grouping that contains every dimension it groups or
+filters by, and from the base metric tables when no grouping does.
+
+Each grouping records the latest metric date it was materialized up to in a
+`MetricWatermark`. That day may still have been filling up, so the cube only
+answers the days before it and later days are read from the base tables.
+"""
+
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, Max, Sum
+from django.utils import timezone
+
+from product_metrics.measures import CHURN_WEIGHTED, REVENUE
+from product_metrics.models import (
+    CustomerSegment,
+    MetricCube,
+    MetricWatermark,
+    Region,
+    SalesChannel,
+    SalesData,
+    UserEngagement,
+)
+
+DIMENSIONS = {
+    "channel": SalesChannel,
+    "region": Region,
+    "segment": CustomerSegment,
+}
+
+CUBE_GROUPINGS = (
+    (),
+    ("channel",),
+    ("region",),
+    ("segment",),
+    ("channel", "region"),
+)
+
+MEASURES = (
+    "revenue",
+    "units_sold",
+    "active_users",
+    "churn_weighted",
+    "sales_rows",
+    "engagement_rows",
+)
+
+
+def grouping_key(dimensions):
+    """Return the `MetricCube.grouping` value of a set of dimensions."""
+    return ",".join(sorted(dimensions))
+
+
+def watermark_key(grouping):
+    """Return the `MetricWatermark.key` of a materialized grouping."""
+    return f"cube:{grouping}"
+
+
+def _grouped(queryset, fields, aggregates):
+    """Aggregate a queryset by `fields`, or as a whole when there are none."""
+    if not fields:
+        return [queryset.aggregate(**aggregates)]
+    return queryset.values(*fields).annotate(**aggregates).order_by()
+
+
+def _new_cells():
+    """Return an empty mapping of grouped values to their measures."""
+    return defaultdict(lambda: dict.fromkeys(MEASURES, 0))
+
+
+def _accumulate(cells, fields, rows):
+    """Add the measures of aggregated `rows` to the cells of their `fields`."""
+    for row in rows:
+        cell = cells[tuple(row[field] for field in fields)]
+        for measure in MEASURES:
+            if measure in row:
+                cell[measure] += row[measure] or 0
+
+
+def _base_cells(fields, filters, cells=None):
+    """Aggregate the base metric tables by `fields`.
+
+    Args:
+        fields: The fields to group by (e.g. `product_id`, `channel_id`).
+        filters: Keyword filters applied to both metric tables.
+        cells: Existing cells to add the measures to, if given.
+
+    Returns:
+        dict: A mapping of the tuple of `fields` values to the measures.
+
+    """
+    cells = _new_cells() if cells is None else cells
+    sales = _grouped(
+        SalesData.objects.filter(**filters),
+        fields,
+        {
+            "revenue": REVENUE,
+            "units_sold": Sum("units_sold"),
+            "sales_rows": Count("id"),
+        },
+    )
+    engagement = _grouped(
+        UserEngagement.objects.filter(**filters),
+        fields,
+        {
+            "churn_weighted": CHURN_WEIGHTED,
+            "active_users": Sum("active_users"),
+            "engagement_rows": Count("id"),
+        },
+    )
+    _accumulate(cells, fields, sales)
+    _accumulate(cells, fields, engagement)
+    return cells
+
+
+def materialize_cube(groupings=CUBE_GROUPINGS, since=None):
+    """Rebuild the materialized groupings of the cube.
+
+    Args:
+        groupings: The dimension combinations to materialize.
+        since: Only rebuild the cells from this date on, if given.
+
+    Returns:
+        dict: The number of materialized cells per grouping.
+
+    """
+    materialized = {}
+    filters = {"date__gte": since} if since else {}
+    # Read before the cells, so rows added meanwhile are after the watermark
+    latest_dates = [
+        model.objects.aggregate(latest=Max("date"))["latest"]
+        for model in (SalesData, UserEngagement)
+    ]
+    latest_date = max(filter(None, latest_dates), default=None)
+    for dimensions in groupings:
+        key = grouping_key(dimensions)
+        dimension_fields = [f"{dimension}_id" for dimension in sorted(dimensions)]
+        fields = ["product_id", "date", *dimension_fields]
+        cells = [
+            MetricCube(grouping=key, **dict(zip(fields, values)), **measures)
+            for values, measures in _base_cells(fields, filters).items()
+        ]
+        with transaction.atomic():
+            MetricCube.objects.filter(grouping=key, **filters).delete()
+            MetricCube.objects.bulk_create(cells, batch_size=1000)
+            MetricWatermark.objects.update_or_create(
+                key=watermark_key(key), defaults={"last_date": latest_date}
+            )
+        materialized[key] = len(cells)
+    return materialized
+
+
+def refresh_recent_cube(days):
+    """Rebuild the cube cells of the last `days` days."""
+    return materialize_cube(since=timezone.localdate() - timedelta(days=days))
+
+
+def find_grouping(dimensions, groupings=CUBE_GROUPINGS):
+    """Return the smallest materialized grouping covering `dimensions`.
+
+    Returns:
+        tuple: The `MetricCube.grouping` value and the date it was
+        materialized up to, or `(None, None)` when no materialized grouping
+        covers the dimensions.
+
+    """
+    candidates = [
+        grouping_key(grouping)
+        for grouping in sorted(groupings, key=len)
+        if set(dimensions) <= set(grouping)
+    ]
+    watermarks = dict(
+        MetricWatermark.objects.filter(
+            key__in=[watermark_key(key) for key in candidates],
+            last_date__isnull=False,
+        ).values_list("key", "last_date")
+    )
+    for key in candidates:
+        if watermark_key(key) in watermarks:
+            return key, watermarks[watermark_key(key)]
+    return None, None
+
+
+def query_cube(group_by=(), product_ids=None, start=None, end=None, **dimension_filters):
+    """Answer a breakdown of the sales and engagement metrics.
+
+    Args:
+        group_by: Dimensions to group by, optionally including `product`
+            and `date`.
+        product_ids: Restrict the breakdown to these products, if given.
+        start: The first date to include, if given.
+        end: The last date to include, if given.
+        **dimension_filters: Dimension ids to slice by (e.g. `region=3`).
+
+    Returns:
+        list: One dict per group with the `<dimension>_id` of every
+        grouped field, the totals of the measures and the active-user
+        weighted `churn_rate`.
+
+    Raises:
+        ValueError: If an unknown dimension is requested.
+
+    """
+    unknown = (set(group_by) - {"product", "date"} - set(DIMENSIONS)) | (
+        set(dimension_filters) - set(DIMENSIONS)
+    )
+    if unknown:
+        raise ValueError(f"Unknown dimensions: {', '.join(sorted(unknown))}.")
+
+    fields = [field if field == "date" else f"{field}_id" for field in group_by]
+    filters = {f"{dimension}_id": value for dimension, value in dimension_filters.items()}
+    if product_ids is not None:
+        filters["product_id__in"] = product_ids
+    if start:
+        filters["date__gte"] = start
+    if end:
+        filters["date__lte"] = end
+
+    dimensions = {*dimension_filters, *(set(group_by) & set(DIMENSIONS))}
+    grouping, materialized_until = find_grouping(dimensions)
+    cells = _new_cells()
+    base_filters = filters
+    if grouping is not None:
+        cube_rows = _grouped(
+            MetricCube.objects.filter(
+                grouping=grouping, date__lt=materialized_until, **filters
+            ),
+            fields,
+            {measure: Sum(measure) for measure in MEASURES},
+        )
+        _accumulate(cells, fields, cube_rows)
+        base_filters = {
+            **filters,
+            "date__gte": max(start, materialized_until) if start else materialized_until,
+        }
+    _base_cells(fields, base_filters, cells)
+    rows = [dict(zip(fields, values), **measures) for values, measures in cells.items()]
+    for row in rows:
+        row["revenue"] = float(row["revenue"])
+        row["churn_rate"] = (
+            row["churn_weighted"] / row["active_users"] if row["active_users"] else None
+        )
+    return sorted(
+        rows,
+        key=lambda row: tuple((row[field] is None, row[field]) for field in fields),
+    )
+
+
+def dimension_names(rows, group_by):
+    """Return the names of the dimension values appearing in `rows`.
+
+    Returns:
+        dict: A mapping of dimension to a mapping of id to name.
+
+    """
+    names = {}
+    for dimension in set(group_by) & set(DIMENSIONS):
+        ids = {row[f"{dimension}_id"] for row in rows} - {None}
+        names[dimension] = dict(
+            DIMENSIONS[dimension].objects.filter(pk__in=ids).values_list("pk", "name")
+        )
+    return names
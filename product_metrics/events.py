@@ -0,0 +1,243 @@
+"""Server-Sent Events delivery of the metric change log.
+
+A single `ChangeBroadcaster` per event loop polls the change log and fans
+new entries out to every open stream, so the database load of the live
+dashboards does not grow with the number of idle connections. Streams that
+fall too far behind are closed and resume from the database using the
+`Last-Event-ID` sent by the browser on reconnect.
+
+Change ids are assigned on insert but become visible on commit, so a
+change may appear after a change with a higher id was delivered. Every
+poll therefore re-reads the last `REPLAY_WINDOW` ids and skips the ones
+already delivered; resumed streams replay the same window below the
+client's last event id, and the client drops events it has already seen.
+"""
+
+import asyncio
+import json
+import logging
+import weakref
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.db import DatabaseError, close_old_connections
+from django.utils import timezone
+
+from product_metrics.models import MetricChange
+
+POLL_INTERVAL = 1.0
+HEARTBEAT_INTERVAL = 15.0
+RECONNECT_DELAY_MS = 3000
+BATCH_SIZE = 500
+REPLAY_WINDOW = 100
+QUEUE_SIZE = 1000
+RETENTION_DAYS = 7
+
+logger = logging.getLogger(__name__)
+
+
+def prune_changes(days=RETENTION_DAYS):
+    """Delete change log entries older than `days` days.
+
+    Returns:
+        int: The number of deleted entries.
+
+    """
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = MetricChange.objects.filter(created_at__lt=cutoff).delete()
+    return deleted
+
+
+async def latest_change_id():
+    """Return the id of the newest change log entry, or 0 if it is empty."""
+    latest = await (
+        MetricChange.objects.order_by("-id").values_list("id", flat=True).afirst()
+    )
+    return latest or 0
+
+
+async def fetch_changes(after, product_ids=None, limit=BATCH_SIZE):
+    """Return up to `limit` change log entries with an id above `after`.
+
+    Args:
+        after: The id of the last change already delivered.
+        product_ids: Restrict the changes to these products, if given.
+        limit: The maximum number of changes to return.
+
+    Returns:
+        list: The changes in id order.
+
+    """
+    changes = MetricChange.objects.filter(id__gt=after)
+    if product_ids is not None:
+        changes = changes.filter(product_id__in=product_ids)
+    return [change async for change in changes.order_by("id")[:limit]]
+
+
+def format_event(change):
+    """Serialize a change log entry as a Server-Sent Event."""
+    data = json.dumps(
+        {
+            "product_id": change.product_id,
+            "source": change.source,
+            "date": change.date.isoformat(),
+            "values": change.values,
+        }
+    )
+    return f"id: {change.id}\nevent: {change.source}\ndata: {data}\n\n"
+
+
+class DeliveredWindow:
+    """Track the change ids delivered near the head of the change log.
+
+    Ids up to `floor` count as delivered. Above it, the ids delivered
+    within `REPLAY_WINDOW` of the highest one are remembered, so a late
+    committed change is delivered once and an earlier one is not repeated.
+
+    """
+
+    def __init__(self, cursor, floor=None):
+        self.cursor = cursor
+        self.floor = cursor if floor is None else floor
+        self.delivered = set()
+
+    @property
+    def start(self):
+        """Return the id after which the change log must be re-read."""
+        return max(self.cursor - REPLAY_WINDOW, self.floor)
+
+    def add(self, change_id):
+        """Record a change id, returning whether it was not delivered yet."""
+        if change_id <= self.start or change_id in self.delivered:
+            return False
+        self.delivered.add(change_id)
+        if change_id > self.cursor:
+            self.cursor = change_id
+            start = self.start
+            self.delivered = {
+                delivered for delivered in self.delivered if delivered > start
+            }
+        return True
+
+
+class ChangeBroadcaster:
+    """Poll the change log once and fan new entries out to subscribers.
+
+    Each subscriber receives new changes on its own bounded queue. A
+    subscriber whose queue overflows is dropped and receives `None`, after
+    which its stream should end and let the client resume.
+
+    """
+
+    def __init__(self):
+        self.subscribers = set()
+        self.task = None
+
+    def subscribe(self):
+        """Register a new subscriber queue and start polling if needed."""
+        queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.subscribers.add(queue)
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+        return queue
+
+    def unsubscribe(self, queue):
+        """Remove a subscriber queue."""
+        self.subscribers.discard(queue)
+
+    def publish(self, change):
+        """Deliver a change to every subscriber, dropping overflowing ones."""
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(change)
+            except asyncio.QueueFull:
+                self.subscribers.discard(queue)
+                queue.get_nowait()
+                queue.put_nowait(None)
+
+    async def run(self):
+        """Poll the change log while there are subscribers.
+
+        Database errors are logged and retried after `POLL_INTERVAL`, so a
+        lost connection does not silently stop every open stream.
+
+        """
+        window = None
+        while self.subscribers:
+            try:
+                if window is None:
+                    window = DeliveredWindow(await latest_change_id())
+                changes = await fetch_changes(window.start)
+            except DatabaseError:
+                logger.exception("Polling the metric change log failed.")
+                await sync_to_async(close_old_connections)()
+                await asyncio.sleep(POLL_INTERVAL)
+                continue
+            for change in changes:
+                if window.add(change.id):
+                    self.publish(change)
+            if len(changes) < BATCH_SIZE:
+                await asyncio.sleep(POLL_INTERVAL)
+
+
+_broadcasters = weakref.WeakKeyDictionary()
+
+
+def get_broadcaster():
+    """Return the broadcaster of the running event loop."""
+    loop = asyncio.get_running_loop()
+    if loop not in _broadcasters:
+        _broadcasters[loop] = ChangeBroadcaster()
+    return _broadcasters[loop]
+
+
+async def stream_changes(last_event_id=None, product_ids=None):
+    """Yield the change log as Server-Sent Events.
+
+    Args:
+        last_event_id: The id of the last event the client received. When
+            given, every later change and the `REPLAY_WINDOW` changes
+            before it are replayed before live changes; otherwise only
+            changes recorded from now on are sent.
+        product_ids: Restrict the stream to these products, if given.
+
+    Yields:
+        str: Server-Sent Event frames, including keep-alive comments.
+
+    """
+    broadcaster = get_broadcaster()
+    queue = broadcaster.subscribe()
+    try:
+        yield f"retry: {RECONNECT_DELAY_MS}\n\n"
+        if last_event_id is None:
+            window = DeliveredWindow(await latest_change_id())
+        else:
+            window = DeliveredWindow(
+                last_event_id, floor=max(last_event_id - REPLAY_WINDOW, 0)
+            )
+            after = window.start
+            while True:
+                changes = await fetch_changes(after, product_ids)
+                for change in changes:
+                    if window.add(change.id):
+                        yield format_event(change)
+                if changes:
+                    after = changes[-1].id
+                if len(changes) < BATCH_SIZE:
+                    break
+
+        while True:
+            try:
+                change = await asyncio.wait_for(queue.get(), HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if change is None:
+                return
+            if not window.add(change.id):
+                continue
+            if product_ids is not None and change.product_id not in product_ids:
+                continue
+            yield format_event(change)
+    finally:
+        broadcaster.unsubscribe(queue)
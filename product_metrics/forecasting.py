@@ -0,0 +1,170 @@
+"""Batch forecasting of daily product metrics.
+
+All products are forecasted together: their trailing daily series are
+loaded into a single 2-D NumPy array (one row per product, one column per
+day, aligned on each product's last observed date) and the model is fitted
+across every row at once instead of looping over products in Python.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Max, Sum
+
+from product_metrics.measures import REVENUE
+from product_metrics.models import ProductForecast, SalesData, UserEngagement
+
+FORECAST_HORIZON = 30
+SEASON_LENGTH = 7
+LOOKBACK_SEASONS = 4
+
+FORECAST_SOURCES = {
+    ProductForecast.Metric.REVENUE: (SalesData, REVENUE),
+    ProductForecast.Metric.ACTIVE_USERS: (UserEngagement, Sum("active_users")),
+}
+
+
+def load_aligned_series(model, aggregate, end_dates, lookback):
+    """Load the trailing daily totals of a metric for many products at once.
+
+    Args:
+        model: The metric model to read from (e.g. `SalesData`).
+        aggregate: The aggregate computing the metric per product and day
+            (e.g. `Sum("active_users")`).
+        end_dates: A mapping of product id to the last observed date of
+            that product's series.
+        lookback: The number of trailing days to load per product.
+
+    Returns:
+        tuple: The list of product ids (in row order) and a float array of
+        shape `(len(product_ids), lookback)` whose last column is each
+        product's end date. Days without data are NaN.
+
+    """
+    product_ids = list(end_dates)
+    series = np.full((len(product_ids), lookback), np.nan)
+    if not product_ids:
+        return product_ids, series
+
+    index = {product_id: row for row, product_id in enumerate(product_ids)}
+    ends = np.array([end_dates[product_id].toordinal() for product_id in product_ids])
+    start = date.fromordinal(int(ends.min()) - lookback + 1)
+
+    rows = (
+        model.objects.filter(product_id__in=product_ids, date__gte=start)
+        .values_list("product_id", "date")
+        .annotate(total=aggregate)
+        .order_by()
+    )
+    data = np.array(
+        [(index[product_id], day.toordinal(), float(total)) for product_id, day, total in rows],
+        dtype=float,
+    ).reshape(-1, 3)
+
+    row_idx = data[:, 0].astype(int)
+    col_idx = lookback - 1 - (ends[row_idx] - data[:, 1].astype(int))
+    in_window = (col_idx >= 0) & (col_idx < lookback)
+    series[row_idx[in_window], col_idx[in_window]] = data[in_window, 2]
+    return product_ids, series
+
+
+def seasonal_naive_with_trend(series, horizon, season_length=SEASON_LENGTH):
+    """Forecast every row of `series` with a seasonal naive model plus trend.
+
+    Each row repeats its last observed season, shifted by the per-day trend
+    measured between the first and the last season of the window. Missing
+    observations are replaced by the row mean before fitting.
+
+    Args:
+        series: A 2-D float array with one row per product.
+        horizon: The number of days to forecast.
+        season_length: The length of the seasonal cycle in days.
+
+    Returns:
+        numpy.ndarray: A non-negative array of shape `(rows, horizon)`.
+
+    """
+    n_seasons = series.shape[1] // season_length
+    if not len(series) or not n_seasons:
+        return np.zeros((len(series), horizon))
+
+    window = series[:, -n_seasons * season_length :]
+    observed = ~np.isnan(window)
+    counts = observed.sum(axis=1)
+    row_mean = np.where(observed, window, 0).sum(axis=1) / np.maximum(counts, 1)
+    filled = np.where(observed, window, row_mean[:, None])
+
+    seasons = filled.reshape(len(filled), n_seasons, season_length)
+    season_means = seasons.mean(axis=2)
+    if n_seasons > 1:
+        slope = (season_means[:, -1] - season_means[:, 0]) / (
+            (n_seasons - 1) * season_length
+        )
+    else:
+        slope = np.zeros(len(filled))
+
+    steps = np.arange(horizon)
+    seasonal = seasons[:, -1, steps % season_length]
+    offsets = (steps // season_length + 1) * season_length
+    return np.clip(seasonal + slope[:, None] * offsets, 0, None)
+
+
+def refresh_forecasts(full=False, horizon=FORECAST_HORIZON):
+    """Refresh the stored forecasts of every forecasted metric.
+
+    Only products whose series ends on a different date than the origin of
+    their stored forecasts are refitted, unless `full` is set.
+
+    Args:
+        full: Refit every product regardless of its stored forecasts.
+        horizon: The number of days to forecast.
+
+    Returns:
+        dict: The number of refreshed products per metric.
+
+    """
+    refreshed = {}
+    for metric, (model, aggregate) in FORECAST_SOURCES.items():
+        end_dates = dict(
+            model.objects.values_list("product_id")
+            .annotate(end_date=Max("date"))
+            .order_by()
+        )
+        if not full:
+            origins = dict(
+                ProductForecast.objects.filter(metric=metric)
+                .values_list("product_id")
+                .annotate(origin_date=Max("origin_date"))
+                .order_by()
+            )
+            end_dates = {
+                product_id: end_date
+                for product_id, end_date in end_dates.items()
+                if origins.get(product_id) != end_date
+            }
+
+        product_ids, series = load_aligned_series(
+            model, aggregate, end_dates, LOOKBACK_SEASONS * SEASON_LENGTH
+        )
+        values = seasonal_naive_with_trend(series, horizon)
+        forecasts = [
+            ProductForecast(
+                product_id=product_id,
+                metric=metric,
+                date=end_dates[product_id] + timedelta(days=step + 1),
+                value=float(value),
+                origin_date=end_dates[product_id],
+            )
+            for row, product_id in enumerate(product_ids)
+            for step, value in enumerate(values[row])
+        ]
+
+        with transaction.atomic():
+            ProductForecast.objects.filter(
+                metric=metric, product_id__in=product_ids
+            ).delete()
+            ProductForecast.objects.bulk_create(forecasts, batch_size=1000)
+        refreshed[metric] = len(product_ids)
+
+    return refreshed
@@ -0,0 +1,219 @@
+"""Database backed job runner for background metric work.
+
+Tasks are plain functions registered by name with `register`. Jobs are
+rows of `MetricJob` created with `enqueue` and executed by the
+`run_metrics_worker` management command. Workers claim jobs with
+`SELECT ... FOR UPDATE SKIP LOCKED` where the database supports it and
+always confirm the claim with a conditional update, so several workers can
+share the queue safely. Workers refresh the heartbeat of their running jobs
+on every poll, and jobs whose heartbeat stops are returned to the queue.
+"""
+
+import time
+import traceback
+import uuid
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from product_metrics.models import MetricJob
+
+DEFAULT_MAX_ATTEMPTS = 3
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 3600
+
+_registry = {}
+
+
+def register(name):
+    """Register a function as the task `name` of the job runner.
+
+    The function is called with the job payload as keyword arguments.
+
+    """
+
+    def decorator(func):
+        _registry[name] = func
+        return func
+
+    return decorator
+
+
+def get_task(name):
+    """Return the function registered as task `name`.
+
+    Raises:
+        LookupError: If no task is registered under `name`.
+
+    """
+    try:
+        return _registry[name]
+    except KeyError:
+        raise LookupError(f"No metrics task is registered as {name!r}.") from None
+
+
+def enqueue(task, payload=None, key=None, run_after=None, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    """Enqueue a job, or return the existing job with the same key.
+
+    Args:
+        task: The name of a registered task.
+        payload: Keyword arguments passed to the task.
+        key: The idempotency key of the job. Defaults to a unique key, so
+            the job is always enqueued.
+        run_after: The earliest time the job may run. Defaults to now.
+        max_attempts: The number of attempts before the job fails.
+
+    Returns:
+        MetricJob: The enqueued or existing job.
+
+    """
+    get_task(task)
+    job, _ = MetricJob.objects.get_or_create(
+        key=key or f"{task}:{uuid.uuid4().hex}",
+        defaults={
+            "task": task,
+            "payload": payload or {},
+            "run_after": run_after or timezone.now(),
+            "max_attempts": max_attempts,
+        },
+    )
+    return job
+
+
+def claim_jobs(worker, limit):
+    """Claim up to `limit` due jobs for a worker.
+
+    Args:
+        worker: The identifier of the claiming worker.
+        limit: The maximum number of jobs to claim.
+
+    Returns:
+        list: The claimed jobs, marked as running.
+
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        due = MetricJob.objects.filter(
+            status=MetricJob.Status.PENDING, run_after__lte=now
+        ).order_by("run_after", "id")
+        if connection.features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)
+        elif connection.features.has_select_for_update:
+            due = due.select_for_update()
+        job_ids = list(due.values_list("id", flat=True)[:limit])
+        MetricJob.objects.filter(
+            id__in=job_ids, status=MetricJob.Status.PENDING
+        ).update(
+            status=MetricJob.Status.RUNNING,
+            worker=worker,
+            started_at=now,
+            heartbeat_at=now,
+            attempts=F("attempts") + 1,
+        )
+    return list(
+        MetricJob.objects.filter(
+            id__in=job_ids,
+            status=MetricJob.Status.RUNNING,
+            worker=worker,
+            started_at=now,
+        )
+    )
+
+
+def backoff_delay(attempts):
+    """Return the delay before retrying a job after `attempts` attempts."""
+    return timedelta(
+        seconds=min(BACKOFF_BASE_SECONDS * 2 ** max(attempts - 1, 0), BACKOFF_MAX_SECONDS)
+    )
+
+
+def run_job(job):
+    """Run a claimed job and record its outcome and timing.
+
+    A failed job is rescheduled with exponential backoff until it has used
+    all of its attempts, after which it is marked as failed. The outcome is
+    discarded if the job was released and claimed again while it ran.
+
+    Returns:
+        MetricJob: The updated job.
+
+    """
+    started = time.monotonic()
+    try:
+        get_task(job.task)(**job.payload)
+    except Exception:
+        job.last_error = traceback.format_exc()
+        if job.attempts < job.max_attempts:
+            job.status = MetricJob.Status.PENDING
+            job.run_after = timezone.now() + backoff_delay(job.attempts)
+        else:
+            job.status = MetricJob.Status.FAILED
+    else:
+        job.status = MetricJob.Status.SUCCEEDED
+        job.last_error = ""
+
+    job.duration = time.monotonic() - started
+    job.total_duration += job.duration
+    job.finished_at = timezone.now()
+    # Only record the outcome while this worker still owns the job; a stale
+    # job may have been released and claimed by another worker meanwhile
+    MetricJob.objects.filter(
+        pk=job.pk,
+        status=MetricJob.Status.RUNNING,
+        worker=job.worker,
+        started_at=job.started_at,
+    ).update(
+        status=job.status,
+        run_after=job.run_after,
+        last_error=job.last_error,
+        duration=job.duration,
+        total_duration=F("total_duration") + job.duration,
+        finished_at=job.finished_at,
+    )
+    return job
+
+
+def heartbeat(worker):
+    """Refresh the heartbeat of the jobs a worker is running.
+
+    Args:
+        worker: The identifier of the worker.
+
+    Returns:
+        int: The number of refreshed jobs.
+
+    """
+    return MetricJob.objects.filter(
+        status=MetricJob.Status.RUNNING, worker=worker
+    ).update(heartbeat_at=timezone.now())
+
+
+def release_stale_jobs(stale_after):
+    """Return jobs of crashed workers to the queue.
+
+    Jobs whose heartbeat is older than `stale_after` are rescheduled when
+    they have attempts left and marked as failed otherwise. Long running
+    jobs of a live worker keep their heartbeat fresh and are not released.
+
+    Args:
+        stale_after: A `timedelta` without heartbeat after which a running
+            job is stale.
+
+    Returns:
+        int: The number of released jobs.
+
+    """
+    cutoff = timezone.now() - stale_after
+    stale = MetricJob.objects.filter(
+        Q(heartbeat_at__lt=cutoff) | Q(heartbeat_at__isnull=True, started_at__lt=cutoff),
+        status=MetricJob.Status.RUNNING,
+    )
+    failed = stale.filter(attempts__gte=F("max_attempts")).update(
+        status=MetricJob.Status.FAILED, last_error="Worker timed out."
+    )
+    retried = stale.update(
+        status=MetricJob.Status.PENDING, last_error="Worker timed out."
+    )
+    return failed + retried
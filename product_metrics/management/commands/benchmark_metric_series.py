@@ -0,0 +1,124 @@
+import json
+import statistics
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Avg, Count
+
+from product_metrics.comparisons import KPI_FAMILIES
+from product_metrics.models import CustomerFeedback, Product, SalesData, UserEngagement
+from product_metrics.series import fetch_series
+
+
+def chart_series(product):
+    """Return the daily chart series of the detail view of a product.
+
+    Returns:
+        list: Tuples of the grouped daily queryset and the mapping of its
+        value fields to their `array` typecodes.
+
+    """
+    return [
+        (
+            SalesData.objects.filter(product=product)
+            .values("date")
+            .annotate(**KPI_FAMILIES["sales_data"][1]),
+            {"revenue": "d", "units_sold": "q"},
+        ),
+        (
+            UserEngagement.objects.filter(product=product)
+            .values("date")
+            .annotate(**KPI_FAMILIES["user_engagement"][1]),
+            {"active_users": "q", "churn_rate": "d"},
+        ),
+        (
+            CustomerFeedback.objects.filter(product=product)
+            .values("date")
+            .annotate(feedback_count=Count("id"), average_rating=Avg("rating")),
+            {"feedback_count": "q", "average_rating": "d"},
+        ),
+    ]
+
+
+def serialize_dicts(series):
+    """Serialize the series by materializing every row as a dict, then
+    building one list of date labels and one list per value field."""
+    payloads = []
+    for queryset, fields in series:
+        rows = list(queryset.order_by("date"))
+        payloads.append(
+            json.dumps(
+                {
+                    "labels": [row["date"].strftime("%Y-%m-%d") for row in rows],
+                    **{field: [float(row[field]) for row in rows] for field in fields},
+                }
+            )
+        )
+    return payloads
+
+
+def serialize_columns(series):
+    """Serialize the series through typed columns with `fetch_series`."""
+    return [fetch_series(queryset, **fields).to_json() for queryset, fields in series]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the time and peak memory of serializing the detail view chart "
+        "series as lists of dicts and as typed columns."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--product",
+            type=int,
+            help="The product to benchmark. Defaults to the product with the most sales rows.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="The number of timed runs of each path.",
+        )
+
+    def handle(self, *args, **options):
+        if options["product"]:
+            product = Product.objects.filter(pk=options["product"]).first()
+        else:
+            product = (
+                Product.objects.annotate(rows=Count("sales_data")).order_by("-rows").first()
+            )
+        if product is None:
+            raise CommandError("No product to benchmark.")
+
+        series = chart_series(product)
+        rows = sum(queryset.count() for queryset, _ in series)
+        self.stdout.write(f"Benchmarking {product} ({rows} daily rows).")
+
+        repeat = max(options["repeat"], 1)
+        for name, serialize in (
+            ("list of dicts", serialize_dicts),
+            ("typed columns", serialize_columns),
+        ):
+            # Warm up the database cache before timing
+            serialize(series)
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                serialize(series)
+                timings.append(time.perf_counter() - started)
+
+            tracemalloc.start()
+            try:
+                serialize(series)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{name}: median {statistics.median(timings) * 1000:.1f} ms, "
+                    f"peak {peak / 1024:.0f} KiB over {repeat} runs."
+                )
+            )
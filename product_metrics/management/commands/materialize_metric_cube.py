@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from product_metrics.cube import materialize_cube, refresh_recent_cube
+
+
+class Command(BaseCommand):
+    help = "Rebuild the pre-aggregated metric cube of the configured groupings."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Only rebuild the cells of the last N days instead of the full history.",
+        )
+
+    def handle(self, *args, **options):
+        if options["days"]:
+            materialized = refresh_recent_cube(options["days"])
+        else:
+            materialized = materialize_cube()
+        for grouping, count in materialized.items():
+            self.stdout.write(
+                self.style.SUCCESS(f"Materialized {count} cells for grouping '{grouping}'.")
+            )
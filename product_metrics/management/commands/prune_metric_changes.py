@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from product_metrics.events import RETENTION_DAYS, prune_changes
+
+
+class Command(BaseCommand):
+    help = "Delete metric change log entries older than the retention period."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=RETENTION_DAYS,
+            help="The number of days of change log to keep.",
+        )
+
+    def handle(self, *args, **options):
+        deleted = prune_changes(days=options["days"])
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} metric changes."))
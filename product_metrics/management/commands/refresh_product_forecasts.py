@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from product_metrics.forecasting import FORECAST_HORIZON, refresh_forecasts
+
+
+class Command(BaseCommand):
+    help = "Refresh the revenue and active users forecasts of all products."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Refit every product instead of only those with new data.",
+        )
+        parser.add_argument(
+            "--horizon",
+            type=int,
+            default=FORECAST_HORIZON,
+            help="The number of days to forecast.",
+        )
+
+    def handle(self, *args, **options):
+        refreshed = refresh_forecasts(full=options["full"], horizon=options["horizon"])
+        for metric, count in refreshed.items():
+            self.stdout.write(
+                self.style.SUCCESS(f"Refreshed {metric} forecasts for {count} products.")
+            )
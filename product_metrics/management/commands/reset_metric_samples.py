@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from product_metrics.approximate import reset_sample_keys
+
+
+class Command(BaseCommand):
+    help = (
+        "Redraw the sample keys used by approximate queries. Run once after "
+        "the sample key column is added to existing metric tables."
+    )
+
+    def handle(self, *args, **options):
+        for label, count in reset_sample_keys().items():
+            self.stdout.write(self.style.SUCCESS(f"Redrew {count} sample keys of {label}."))
@@ -0,0 +1,89 @@
+import os
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+
+from product_metrics.jobs import claim_jobs, heartbeat, release_stale_jobs, run_job
+
+
+class Command(BaseCommand):
+    help = "Run background metric jobs from the database job queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=4,
+            help="The number of jobs to run concurrently.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait between polls when the queue is empty.",
+        )
+        parser.add_argument(
+            "--stale-after",
+            type=int,
+            default=300,
+            help=(
+                "Seconds without a heartbeat after which a running job is "
+                "considered abandoned. Must exceed the poll interval."
+            ),
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once no due jobs are left instead of polling forever.",
+        )
+
+    def handle(self, *args, **options):
+        worker = f"{socket.gethostname()}:{os.getpid()}"
+        threads = max(options["threads"], 1)
+        stale_after = timedelta(seconds=options["stale_after"])
+        running = set()
+        self.stdout.write(f"Worker {worker} started with {threads} threads.")
+
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            try:
+                while True:
+                    # Drop connections the database closed or that outlived
+                    # CONN_MAX_AGE while the loop was waiting
+                    close_old_connections()
+                    running = {future for future in running if not future.done()}
+                    if running:
+                        heartbeat(worker)
+                    release_stale_jobs(stale_after)
+                    free = threads - len(running)
+                    jobs = claim_jobs(worker, free) if free else []
+                    for job in jobs:
+                        running.add(pool.submit(self.run_claimed_job, job))
+
+                    if options["once"] and not jobs and not running:
+                        break
+                    if jobs:
+                        continue
+                    if running:
+                        wait(running, timeout=options["poll_interval"], return_when=FIRST_COMPLETED)
+                    else:
+                        time.sleep(options["poll_interval"])
+            except KeyboardInterrupt:
+                self.stdout.write("Waiting for running jobs to finish...")
+
+    def run_claimed_job(self, job):
+        """Run a job in a pool thread and report its outcome."""
+        try:
+            job = run_job(job)
+            style = self.style.SUCCESS if job.status == job.Status.SUCCEEDED else self.style.WARNING
+            self.stdout.write(
+                style(
+                    f"{job.task} ({job.key}) {job.status} after attempt "
+                    f"{job.attempts} in {job.duration:.2f}s."
+                )
+            )
+        finally:
+            connections.close_all()
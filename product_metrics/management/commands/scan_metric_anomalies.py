@@ -0,0 +1,23 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from product_metrics.anomalies import scan_anomalies
+
+
+class Command(BaseCommand):
+    help = "Scan metric days newer than the stored watermarks for anomalies."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--until",
+            type=date.fromisoformat,
+            help="The last metric date to scan (YYYY-MM-DD). Defaults to yesterday.",
+        )
+
+    def handle(self, *args, **options):
+        recorded = scan_anomalies(until=options["until"])
+        for source, count in recorded.items():
+            self.stdout.write(
+                self.style.SUCCESS(f"Recorded {count} anomalies from {source}.")
+            )
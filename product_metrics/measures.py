@@ -0,0 +1,33 @@
+"""Aggregate expressions shared by every consumer of the metric tables.
+
+Revenue is recorded in the currency of each sale and no exchange rates are
+stored, so amounts of different currencies cannot be added together.
+Revenue KPIs, comparisons, anomalies, forecasts and the cube therefore only
+sum the revenue of the reporting currency, set with the
+`PRODUCT_METRICS_REPORTING_CURRENCY` setting (an ISO 4217 code).
+
+Churn rates are percentages of each row's active users, so the churn of a
+group of rows is their average weighted by active users. `CHURN_WEIGHTED`
+is the additive part kept by the cube. Both read the `active_users` field
+and must precede an `active_users` annotation of the same query, which
+would otherwise shadow it.
+"""
+
+from django.conf import settings
+from django.db.models import F, FloatField, Q, Sum, Value
+from django.db.models.functions import Coalesce, NullIf
+
+DEFAULT_REPORTING_CURRENCY = "USD"
+
+REPORTING_CURRENCY = getattr(
+    settings, "PRODUCT_METRICS_REPORTING_CURRENCY", DEFAULT_REPORTING_CURRENCY
+)
+
+REVENUE = Sum("revenue", filter=Q(currency__code=REPORTING_CURRENCY), default=0)
+
+CHURN_WEIGHTED = Sum(F("churn_rate") * F("active_users"))
+CHURN_RATE = Coalesce(
+    CHURN_WEIGHTED / NullIf(Sum("active_users"), 0),
+    Value(0.0),
+    output_field=FloatField(),
+)
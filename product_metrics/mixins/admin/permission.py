@@ -1,6 +1,7 @@
 from typing import Optional
 
 from django.contrib.admin import ModelAdmin
+from django.db.models import Q, QuerySet
 from django.http import HttpRequest
 
 from product_metrics.settings.conf import config
@@ -43,3 +44,46 @@ class AdminPermissionControlMixin(BasePermissionControlMixin):
     def has_module_permission(self, request: HttpRequest) -> bool:
         """Determines if the user has any permission in the given app label."""
         return getattr(config, f"{self.permission_prefix}has_module_permission")
+
+
+class ProductAccessControlMixin:
+    """A mixin restricting a model admin to the products the user may
+    access.
+
+    Applies the queryset filter of the configured view permission class,
+    when it defines one, so the changelist, object pages and autocomplete
+    lookups only expose rows of granted products, and the product field of
+    the forms only accepts granted products.
+
+    """
+
+    product_access_field = "product"
+
+    def get_product_access_filter(self, request: HttpRequest, field: str) -> Q:
+        """Returns the filter limiting `field` to the accessible products."""
+        permission_class = config.view_permission_class
+        if permission_class and hasattr(permission_class, "get_queryset_filter"):
+            return permission_class().get_queryset_filter(request, self, field)
+        return Q()
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        """Returns the queryset restricted to the accessible products."""
+        return (
+            super()
+            .get_queryset(request)
+            .filter(self.get_product_access_filter(request, self.product_access_field))
+        )
+
+    def formfield_for_foreignkey(self, db_field, request: HttpRequest, **kwargs):
+        """Limits the choices of the product field to the accessible
+        products."""
+        if db_field.name == self.product_access_field and "queryset" not in kwargs:
+            queryset = self.get_field_queryset(kwargs.get("using"), db_field, request)
+            if queryset is None:
+                queryset = db_field.remote_field.model._default_manager.using(
+                    kwargs.get("using")
+                )
+            kwargs["queryset"] = queryset.filter(
+                self.get_product_access_filter(request, "pk")
+            )
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
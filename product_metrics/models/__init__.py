@@ -3,3 +3,14 @@ from .sales_data import SalesData
 from .user_engagement import UserEngagement
 from .customer_feedback import CustomerFeedback
 from .currency import Currency
+from .product_forecast import ProductForecast
+from .metric_watermark import MetricWatermark
+from .metric_baseline import MetricBaseline
+from .metric_anomaly import MetricAnomaly
+from .metric_change import MetricChange
+from .metric_job import MetricJob
+from .sales_channel import SalesChannel
+from .region import Region
+from .customer_segment import CustomerSegment
+from .metric_cube import MetricCube
+from .product_access_grant import ProductAccessGrant
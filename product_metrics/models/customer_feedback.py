@@ -2,6 +2,7 @@ from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils.translation import gettext_lazy as _
 from product_metrics.models.product import Product
+from product_metrics.models.sampling import random_sample_key
 
 
 class CustomerFeedback(models.Model):
@@ -17,6 +18,7 @@ class CustomerFeedback(models.Model):
         date (date): The date of the feedback
         rating (float): Customer rating out of 5
         feedback (str): Additional feedback provided by the customer
+        sample_key (float): Uniform random key used for sampling
     """
 
     product = models.ForeignKey(
@@ -46,11 +48,20 @@ class CustomerFeedback(models.Model):
         help_text=_("Additional feedback provided by the customer."),
         db_comment="Stores additional customer feedback.",
     )
+    sample_key = models.FloatField(
+        default=random_sample_key,
+        editable=False,
+        db_index=True,
+        verbose_name=_("Sample Key"),
+        help_text=_("Uniform random key used to draw samples for approximate queries."),
+        db_comment="Stores a uniform random number in [0, 1) for sampling.",
+    )
 
     class Meta:
         db_table_comment = "Stores customer feedback for products."
         verbose_name = _("Customer Feedback")
         verbose_name_plural = _("Customer Feedback")
+        indexes = [models.Index(fields=["product", "sample_key"])]
 
     def __str__(self):
         return f"{self.product.name} - {self.date}"
@@ -0,0 +1,38 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class CustomerSegment(models.Model):
+    """
+    A model representing a customer segment dimension of the metric data.
+
+    Sales data and user engagement can optionally be attributed to the
+    customer segment they were generated by (e.g. consumer, enterprise).
+
+    Attributes:
+        name (str): Unique name of the customer segment
+        description (str): A description of the customer segment
+    """
+
+    name = models.CharField(
+        max_length=100,
+        unique=True,
+        verbose_name=_("Customer Segment Name"),
+        help_text=_("The unique name of the customer segment."),
+        db_comment="Stores the unique name of the customer segment.",
+    )
+    description = models.TextField(
+        blank=True,
+        null=True,
+        verbose_name=_("Customer Segment Description"),
+        help_text=_("A brief description of the customer segment."),
+        db_comment="Stores a description of the customer segment.",
+    )
+
+    class Meta:
+        db_table_comment = "Stores the customer segments used to break down metrics."
+        verbose_name = _("Customer Segment")
+        verbose_name_plural = _("Customer Segments")
+
+    def __str__(self):
+        return self.name
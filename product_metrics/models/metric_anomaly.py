@@ -0,0 +1,85 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from product_metrics.models.product import Product
+
+
+class MetricAnomaly(models.Model):
+    """
+    A model representing an anomalous metric day of a product.
+
+    Anomalies are recorded by the incremental anomaly scan when a daily
+    metric value deviates from its running baseline by more than the
+    configured number of standard deviations.
+
+    Attributes:
+        product (Product): The associated product
+        metric (str): The name of the anomalous metric
+        date (date): The date of the anomalous value
+        value (float): The observed value
+        expected (float): The baseline mean before the value was observed
+        z_score (float): The deviation from the baseline in standard deviations
+        severity (str): The severity of the anomaly
+        detected_at (datetime): Timestamp when the anomaly was recorded
+    """
+
+    class Severity(models.TextChoices):
+        WARNING = "warning", _("Warning")
+        CRITICAL = "critical", _("Critical")
+
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name="anomalies",
+        verbose_name=_("Product"),
+        help_text=_("The product associated with this anomaly."),
+        db_comment="Foreign key to the Product model.",
+    )
+    metric = models.CharField(
+        max_length=32,
+        verbose_name=_("Metric"),
+        help_text=_("The name of the anomalous metric."),
+        db_comment="Stores the name of the anomalous metric.",
+    )
+    date = models.DateField(
+        verbose_name=_("Date"),
+        help_text=_("The date of the anomalous value."),
+        db_comment="Stores the date of the anomalous value.",
+        db_index=True,
+    )
+    value = models.FloatField(
+        verbose_name=_("Value"),
+        help_text=_("The observed value of the metric."),
+        db_comment="Stores the observed metric value.",
+    )
+    expected = models.FloatField(
+        verbose_name=_("Expected"),
+        help_text=_("The baseline mean before the value was observed."),
+        db_comment="Stores the expected metric value.",
+    )
+    z_score = models.FloatField(
+        verbose_name=_("Z-Score"),
+        help_text=_("The deviation from the baseline in standard deviations."),
+        db_comment="Stores the deviation in standard deviations.",
+    )
+    severity = models.CharField(
+        max_length=16,
+        choices=Severity.choices,
+        verbose_name=_("Severity"),
+        help_text=_("The severity of the anomaly."),
+        db_comment="Stores the severity of the anomaly.",
+    )
+    detected_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Detected At"),
+        help_text=_("The date and time when the anomaly was recorded."),
+        db_comment="Stores the detection timestamp of the anomaly.",
+    )
+
+    class Meta:
+        db_table_comment = "Stores anomalous metric days of products."
+        verbose_name = _("Metric Anomaly")
+        verbose_name_plural = _("Metric Anomalies")
+        unique_together = ["product", "metric", "date"]
+
+    def __str__(self):
+        return f"{self.product.name} - {self.metric} - {self.date}"
@@ -0,0 +1,70 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from product_metrics.models.product import Product
+
+
+class MetricBaseline(models.Model):
+    """
+    A model representing the running statistics of a product metric.
+
+    This model keeps an exponentially weighted moving mean and variance per
+    product and metric, so anomaly detection can score a new metric day
+    without reading the metric's history again.
+
+    Attributes:
+        product (Product): The associated product
+        metric (str): The name of the tracked metric
+        mean (float): Exponentially weighted moving mean
+        variance (float): Exponentially weighted moving variance
+        observations (int): Number of metric days folded into the statistics
+        last_date (date): The last metric date folded into the statistics
+    """
+
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name="metric_baselines",
+        verbose_name=_("Product"),
+        help_text=_("The product associated with these statistics."),
+        db_comment="Foreign key to the Product model.",
+    )
+    metric = models.CharField(
+        max_length=32,
+        verbose_name=_("Metric"),
+        help_text=_("The name of the tracked metric."),
+        db_comment="Stores the name of the tracked metric.",
+    )
+    mean = models.FloatField(
+        default=0,
+        verbose_name=_("Mean"),
+        help_text=_("The exponentially weighted moving mean."),
+        db_comment="Stores the EWMA mean of the metric.",
+    )
+    variance = models.FloatField(
+        default=0,
+        verbose_name=_("Variance"),
+        help_text=_("The exponentially weighted moving variance."),
+        db_comment="Stores the EWMA variance of the metric.",
+    )
+    observations = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Observations"),
+        help_text=_("The number of metric days folded into the statistics."),
+        db_comment="Stores the number of observed metric days.",
+    )
+    last_date = models.DateField(
+        blank=True,
+        null=True,
+        verbose_name=_("Last Date"),
+        help_text=_("The last metric date folded into the statistics."),
+        db_comment="Stores the last observed metric date.",
+    )
+
+    class Meta:
+        db_table_comment = "Stores running statistics of product metrics."
+        verbose_name = _("Metric Baseline")
+        verbose_name_plural = _("Metric Baselines")
+        unique_together = ["product", "metric"]
+
+    def __str__(self):
+        return f"{self.product.name} - {self.metric}"
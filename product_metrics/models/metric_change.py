@@ -0,0 +1,68 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from product_metrics.models.product import Product
+
+
+class MetricChange(models.Model):
+    """
+    A model representing an entry of the metric change log.
+
+    An entry is appended whenever a metric row is saved and carries the
+    changed values of that metric day. The auto-incrementing primary key
+    doubles as the event id of the live dashboard stream, which lets
+    clients resume from the last event they received.
+
+    Attributes:
+        product (Product): The associated product
+        source (str): The metric model the change originates from
+        date (date): The metric date that changed
+        values (dict): The changed metric values of that date
+        created_at (datetime): Timestamp when the change was recorded
+    """
+
+    class Source(models.TextChoices):
+        SALES_DATA = "sales_data", _("Sales Data")
+        USER_ENGAGEMENT = "user_engagement", _("User Engagement")
+        CUSTOMER_FEEDBACK = "customer_feedback", _("Customer Feedback")
+
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name="metric_changes",
+        verbose_name=_("Product"),
+        help_text=_("The product associated with this change."),
+        db_comment="Foreign key to the Product model.",
+    )
+    source = models.CharField(
+        max_length=32,
+        choices=Source.choices,
+        verbose_name=_("Source"),
+        help_text=_("The metric model the change originates from."),
+        db_comment="Stores the name of the changed metric model.",
+    )
+    date = models.DateField(
+        verbose_name=_("Date"),
+        help_text=_("The metric date that changed."),
+        db_comment="Stores the changed metric date.",
+    )
+    values = models.JSONField(
+        verbose_name=_("Values"),
+        help_text=_("The changed metric values of this date."),
+        db_comment="Stores the changed metric values.",
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Created At"),
+        help_text=_("The date and time when the change was recorded."),
+        db_comment="Stores the creation timestamp of the change.",
+        db_index=True,
+    )
+
+    class Meta:
+        db_table_comment = "Stores the change log of product metrics."
+        verbose_name = _("Metric Change")
+        verbose_name_plural = _("Metric Changes")
+        indexes = [models.Index(fields=["product", "id"])]
+
+    def __str__(self):
+        return f"{self.product.name} - {self.source} - {self.date}"
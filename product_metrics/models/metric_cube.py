@@ -0,0 +1,130 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from product_metrics.models.product import Product
+from product_metrics.models.sales_channel import SalesChannel
+from product_metrics.models.region import Region
+from product_metrics.models.customer_segment import CustomerSegment
+
+
+class MetricCube(models.Model):
+    """
+    A model representing a cell of the pre-aggregated metric cube.
+
+    Each materialized grouping stores the daily sales and engagement totals
+    of every product per combination of its dimensions. Dimensions that are
+    not part of the grouping are rolled up and left empty, while an empty
+    dimension inside the grouping stands for metric rows not attributed to
+    any value of that dimension.
+
+    Attributes:
+        grouping (str): Comma-separated dimensions of the materialization
+        product (Product): The associated product
+        date (date): The date of the aggregated metrics
+        channel (SalesChannel): The sales channel of the cell, if grouped
+        region (Region): The region of the cell, if grouped
+        segment (CustomerSegment): The customer segment of the cell, if grouped
+        revenue (decimal): Total revenue of the cell
+        units_sold (int): Total units sold of the cell
+        active_users (int): Total active users of the cell
+        churn_weighted (float): Sum of churn rates weighted by active users
+        sales_rows (int): Number of aggregated sales data rows
+        engagement_rows (int): Number of aggregated user engagement rows
+    """
+
+    grouping = models.CharField(
+        max_length=64,
+        blank=True,
+        verbose_name=_("Grouping"),
+        help_text=_("Comma-separated dimensions of the materialization."),
+        db_comment="Stores the dimensions the cell is grouped by.",
+    )
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name="metric_cube",
+        verbose_name=_("Product"),
+        help_text=_("The product associated with this cell."),
+        db_comment="Foreign key to the Product model.",
+    )
+    date = models.DateField(
+        verbose_name=_("Date"),
+        help_text=_("The date of the aggregated metrics."),
+        db_comment="Stores the date of the aggregated metrics.",
+    )
+    channel = models.ForeignKey(
+        SalesChannel,
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+        related_name="metric_cube",
+        verbose_name=_("Sales Channel"),
+        help_text=_("The sales channel of this cell, if grouped by channel."),
+        db_comment="Optional foreign key to the SalesChannel model.",
+    )
+    region = models.ForeignKey(
+        Region,
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+        related_name="metric_cube",
+        verbose_name=_("Region"),
+        help_text=_("The region of this cell, if grouped by region."),
+        db_comment="Optional foreign key to the Region model.",
+    )
+    segment = models.ForeignKey(
+        CustomerSegment,
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+        related_name="metric_cube",
+        verbose_name=_("Customer Segment"),
+        help_text=_("The customer segment of this cell, if grouped by segment."),
+        db_comment="Optional foreign key to the CustomerSegment model.",
+    )
+    revenue = models.DecimalField(
+        max_digits=18,
+        decimal_places=2,
+        default=0,
+        verbose_name=_("Revenue"),
+        help_text=_("The total revenue of this cell."),
+        db_comment="Stores the total revenue of the cell.",
+    )
+    units_sold = models.BigIntegerField(
+        default=0,
+        verbose_name=_("Units Sold"),
+        help_text=_("The total units sold of this cell."),
+        db_comment="Stores the total units sold of the cell.",
+    )
+    active_users = models.BigIntegerField(
+        default=0,
+        verbose_name=_("Active Users"),
+        help_text=_("The total active users of this cell."),
+        db_comment="Stores the total active users of the cell.",
+    )
+    churn_weighted = models.FloatField(
+        default=0,
+        verbose_name=_("Weighted Churn"),
+        help_text=_("The sum of churn rates weighted by active users."),
+        db_comment="Stores the active-user weighted sum of churn rates.",
+    )
+    sales_rows = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Sales Rows"),
+        help_text=_("The number of aggregated sales data rows."),
+        db_comment="Stores the number of aggregated sales data rows.",
+    )
+    engagement_rows = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Engagement Rows"),
+        help_text=_("The number of aggregated user engagement rows."),
+        db_comment="Stores the number of aggregated user engagement rows.",
+    )
+
+    class Meta:
+        db_table_comment = "Stores pre-aggregated metrics per dimension combination."
+        verbose_name = _("Metric Cube Cell")
+        verbose_name_plural = _("Metric Cube")
+        indexes = [models.Index(fields=["grouping", "product", "date"])]
+
+    def __str__(self):
+        return f"{self.product.name} - {self.grouping or 'total'} - {self.date}"
@@ -0,0 +1,146 @@
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class MetricJob(models.Model):
+    """
+    A model representing a background job of the metrics job runner.
+
+    Jobs are claimed by `run_metrics_worker` processes, retried with
+    exponential backoff when they fail and keep the timing of their runs.
+    The unique key makes enqueueing idempotent: enqueueing a job with the
+    key of an existing job returns the existing job.
+
+    Attributes:
+        key (str): Unique idempotency key of the job
+        task (str): Name of the registered task to run
+        payload (dict): Keyword arguments passed to the task
+        status (str): Current status of the job
+        attempts (int): Number of attempts made so far
+        max_attempts (int): Number of attempts before the job fails
+        run_after (datetime): Earliest time the job may run
+        worker (str): Identifier of the worker that claimed the job
+        started_at (datetime): Start of the latest attempt
+        heartbeat_at (datetime): Latest sign of life of the running attempt
+        finished_at (datetime): End of the latest attempt
+        duration (float): Duration of the latest attempt in seconds
+        total_duration (float): Duration of all attempts in seconds
+        last_error (str): Traceback of the latest failed attempt
+        created_at (datetime): Timestamp when the job was enqueued
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        SUCCEEDED = "succeeded", _("Succeeded")
+        FAILED = "failed", _("Failed")
+
+    key = models.CharField(
+        max_length=255,
+        unique=True,
+        verbose_name=_("Key"),
+        help_text=_("Unique idempotency key of the job."),
+        db_comment="Stores the unique idempotency key of the job.",
+    )
+    task = models.CharField(
+        max_length=100,
+        verbose_name=_("Task"),
+        help_text=_("Name of the registered task to run."),
+        db_comment="Stores the name of the task to run.",
+    )
+    payload = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name=_("Payload"),
+        help_text=_("Keyword arguments passed to the task."),
+        db_comment="Stores the keyword arguments of the task.",
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name=_("Status"),
+        help_text=_("Current status of the job."),
+        db_comment="Stores the current status of the job.",
+    )
+    attempts = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Attempts"),
+        help_text=_("Number of attempts made so far."),
+        db_comment="Stores the number of attempts made.",
+    )
+    max_attempts = models.PositiveIntegerField(
+        default=3,
+        verbose_name=_("Max Attempts"),
+        help_text=_("Number of attempts before the job is marked as failed."),
+        db_comment="Stores the maximum number of attempts.",
+    )
+    run_after = models.DateTimeField(
+        default=timezone.now,
+        verbose_name=_("Run After"),
+        help_text=_("Earliest time the job may run."),
+        db_comment="Stores the earliest time the job may run.",
+    )
+    worker = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name=_("Worker"),
+        help_text=_("Identifier of the worker that claimed the job."),
+        db_comment="Stores the identifier of the claiming worker.",
+    )
+    started_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        verbose_name=_("Started At"),
+        help_text=_("Start of the latest attempt."),
+        db_comment="Stores the start timestamp of the latest attempt.",
+    )
+    heartbeat_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        verbose_name=_("Heartbeat At"),
+        help_text=_("Latest time the worker reported the running attempt as alive."),
+        db_comment="Stores the latest heartbeat timestamp of the running attempt.",
+    )
+    finished_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        verbose_name=_("Finished At"),
+        help_text=_("End of the latest attempt."),
+        db_comment="Stores the end timestamp of the latest attempt.",
+    )
+    duration = models.FloatField(
+        blank=True,
+        null=True,
+        verbose_name=_("Duration"),
+        help_text=_("Duration of the latest attempt in seconds."),
+        db_comment="Stores the duration of the latest attempt in seconds.",
+    )
+    total_duration = models.FloatField(
+        default=0,
+        verbose_name=_("Total Duration"),
+        help_text=_("Duration of all attempts in seconds."),
+        db_comment="Stores the duration of all attempts in seconds.",
+    )
+    last_error = models.TextField(
+        blank=True,
+        verbose_name=_("Last Error"),
+        help_text=_("Traceback of the latest failed attempt."),
+        db_comment="Stores the traceback of the latest failed attempt.",
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Created At"),
+        help_text=_("The date and time when the job was enqueued."),
+        db_comment="Stores the creation timestamp of the job.",
+    )
+
+    class Meta:
+        db_table_comment = "Stores background jobs of the metrics job runner."
+        verbose_name = _("Metric Job")
+        verbose_name_plural = _("Metric Jobs")
+        indexes = [models.Index(fields=["status", "run_after"])]
+
+    def __str__(self):
+        return f"{self.task} ({self.key})"
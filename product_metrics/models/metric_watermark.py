@@ -0,0 +1,46 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class MetricWatermark(models.Model):
+    """
+    A model representing the progress of an incremental metric scan.
+
+    Each scan stores the last metric date it fully processed so that the
+    next run only reads metric days newer than the watermark. The metric cube
+    also records the date each grouping was materialized up to.
+
+    Attributes:
+        key (str): Unique name of the scan and its source
+        last_date (date): The last metric date processed by the scan
+        updated_at (datetime): Timestamp when the watermark last advanced
+    """
+
+    key = models.CharField(
+        max_length=100,
+        unique=True,
+        verbose_name=_("Key"),
+        help_text=_("Unique name of the scan this watermark belongs to."),
+        db_comment="Stores the unique name of the scan.",
+    )
+    last_date = models.DateField(
+        blank=True,
+        null=True,
+        verbose_name=_("Last Date"),
+        help_text=_("The last metric date processed by the scan."),
+        db_comment="Stores the last processed metric date.",
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name=_("Updated At"),
+        help_text=_("The date and time when the watermark last advanced."),
+        db_comment="Stores the last update timestamp of the watermark.",
+    )
+
+    class Meta:
+        db_table_comment = "Stores the progress of incremental metric scans."
+        verbose_name = _("Metric Watermark")
+        verbose_name_plural = _("Metric Watermarks")
+
+    def __str__(self):
+        return f"{self.key} - {self.last_date}"
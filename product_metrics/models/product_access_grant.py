@@ -0,0 +1,74 @@
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.db import models
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+from product_metrics.models.product import Product
+
+
+class ProductAccessGrant(models.Model):
+    """
+    A model granting a user or a group access to a product's metrics.
+
+    Grants are resolved in SQL by the `HasProductAccess` permission class,
+    which restricts every product-scoped queryset to the products granted
+    to the requesting user directly or through one of their groups.
+
+    Attributes:
+        product (Product): The product access is granted to
+        user (User): The user granted access, if granted to a user
+        group (Group): The group granted access, if granted to a group
+        created_at (datetime): Timestamp when the grant was created
+    """
+
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name="access_grants",
+        verbose_name=_("Product"),
+        help_text=_("The product access is granted to."),
+        db_comment="Foreign key to the Product model.",
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+        related_name="product_access_grants",
+        verbose_name=_("User"),
+        help_text=_("The user granted access to the product."),
+        db_comment="Optional foreign key to the granted user.",
+    )
+    group = models.ForeignKey(
+        Group,
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+        related_name="product_access_grants",
+        verbose_name=_("Group"),
+        help_text=_("The group granted access to the product."),
+        db_comment="Optional foreign key to the granted group.",
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Created At"),
+        help_text=_("The date and time when the grant was created."),
+        db_comment="Stores the creation timestamp of the grant.",
+    )
+
+    class Meta:
+        db_table_comment = "Stores per-product access grants of users and groups."
+        verbose_name = _("Product Access Grant")
+        verbose_name_plural = _("Product Access Grants")
+        unique_together = [["user", "product"], ["group", "product"]]
+        constraints = [
+            models.CheckConstraint(
+                condition=Q(user__isnull=False, group__isnull=True)
+                | Q(user__isnull=True, group__isnull=False),
+                name="product_access_grant_user_or_group",
+                violation_error_message=_("Grant access to either a user or a group."),
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.product.name} - {self.user or self.group}"
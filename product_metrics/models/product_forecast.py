@@ -0,0 +1,71 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from product_metrics.models.product import Product
+
+
+class ProductForecast(models.Model):
+    """
+    A model representing a forecasted daily metric value for a product.
+
+    Forecasts are produced in batch for every product at once and are
+    refreshed incrementally: a product's forecasts are only recomputed when
+    its underlying metric series has advanced past the stored origin date.
+
+    Attributes:
+        product (Product): The associated product
+        metric (str): The forecasted metric (revenue or active users)
+        date (date): The future date the forecast applies to
+        value (float): The forecasted value
+        origin_date (date): The last observed date the forecast is based on
+        created_at (datetime): Timestamp when the forecast was generated
+    """
+
+    class Metric(models.TextChoices):
+        REVENUE = "revenue", _("Revenue")
+        ACTIVE_USERS = "active_users", _("Active Users")
+
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name="forecasts",
+        verbose_name=_("Product"),
+        help_text=_("The product associated with this forecast."),
+        db_comment="Foreign key to the Product model.",
+    )
+    metric = models.CharField(
+        max_length=32,
+        choices=Metric.choices,
+        verbose_name=_("Metric"),
+        help_text=_("The metric being forecasted."),
+        db_comment="Stores the name of the forecasted metric.",
+    )
+    date = models.DateField(
+        verbose_name=_("Date"),
+        help_text=_("The date the forecast applies to."),
+        db_comment="Stores the forecasted date.",
+    )
+    value = models.FloatField(
+        verbose_name=_("Value"),
+        help_text=_("The forecasted value for this date."),
+        db_comment="Stores the forecasted value.",
+    )
+    origin_date = models.DateField(
+        verbose_name=_("Origin Date"),
+        help_text=_("The last observed date this forecast is based on."),
+        db_comment="Stores the last observed date used to fit the forecast.",
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Created At"),
+        help_text=_("The date and time when the forecast was generated."),
+        db_comment="Stores the generation timestamp of the forecast.",
+    )
+
+    class Meta:
+        db_table_comment = "Stores forecasted daily metrics for products."
+        verbose_name = _("Product Forecast")
+        verbose_name_plural = _("Product Forecasts")
+        unique_together = ["product", "metric", "date"]
+
+    def __str__(self):
+        return f"{self.product.name} - {self.metric} - {self.date}"
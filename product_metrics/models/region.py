@@ -0,0 +1,38 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class Region(models.Model):
+    """
+    A model representing a region dimension of the metric data.
+
+    Sales data and user engagement can optionally be attributed to the
+    geographic region they were generated in.
+
+    Attributes:
+        name (str): Unique name of the region
+        description (str): A description of the region
+    """
+
+    name = models.CharField(
+        max_length=100,
+        unique=True,
+        verbose_name=_("Region Name"),
+        help_text=_("The unique name of the region."),
+        db_comment="Stores the unique name of the region.",
+    )
+    description = models.TextField(
+        blank=True,
+        null=True,
+        verbose_name=_("Region Description"),
+        help_text=_("A brief description of the region."),
+        db_comment="Stores a description of the region.",
+    )
+
+    class Meta:
+        db_table_comment = "Stores the regions used to break down metrics."
+        verbose_name = _("Region")
+        verbose_name_plural = _("Regions")
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,38 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class SalesChannel(models.Model):
+    """
+    A model representing a sales channel dimension of the metric data.
+
+    Sales data and user engagement can optionally be attributed to the
+    channel they were generated through (e.g. web, mobile, retail).
+
+    Attributes:
+        name (str): Unique name of the sales channel
+        description (str): A description of the sales channel
+    """
+
+    name = models.CharField(
+        max_length=100,
+        unique=True,
+        verbose_name=_("Sales Channel Name"),
+        help_text=_("The unique name of the sales channel."),
+        db_comment="Stores the unique name of the sales channel.",
+    )
+    description = models.TextField(
+        blank=True,
+        null=True,
+        verbose_name=_("Sales Channel Description"),
+        help_text=_("A brief description of the sales channel."),
+        db_comment="Stores a description of the sales channel.",
+    )
+
+    class Meta:
+        db_table_comment = "Stores the sales channels used to break down metrics."
+        verbose_name = _("Sales Channel")
+        verbose_name_plural = _("Sales Channels")
+
+    def __str__(self):
+        return self.name
@@ -1,8 +1,13 @@
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.core.validators import MinValueValidator
 from django.utils.translation import gettext_lazy as _
 from product_metrics.models.product import Product
+from product_metrics.models.sampling import random_sample_key
 from product_metrics.models.currency import Currency
+from product_metrics.models.sales_channel import SalesChannel
+from product_metrics.models.region import Region
+from product_metrics.models.customer_segment import CustomerSegment
 
 
 class SalesData(models.Model):
@@ -19,6 +24,10 @@ class SalesData(models.Model):
         units_sold (int): Number of units sold
         revenue (decimal): Revenue generated in the specified currency
         currency (Currency): The currency of the revenue
+        channel (SalesChannel): The optional sales channel dimension
+        region (Region): The optional region dimension
+        segment (CustomerSegment): The optional customer segment dimension
+        sample_key (float): Uniform random key used for sampling
     """
 
     product = models.ForeignKey(
@@ -57,12 +66,66 @@ class SalesData(models.Model):
         help_text=_("The currency of the revenue."),
         db_comment="Foreign key to the Currency model.",
     )
+    channel = models.ForeignKey(
+        SalesChannel,
+        on_delete=models.PROTECT,
+        blank=True,
+        null=True,
+        related_name="sales_data",
+        verbose_name=_("Sales Channel"),
+        help_text=_("The sales channel this sales data is attributed to, if any."),
+        db_comment="Optional foreign key to the SalesChannel model.",
+    )
+    region = models.ForeignKey(
+        Region,
+        on_delete=models.PROTECT,
+        blank=True,
+        null=True,
+        related_name="sales_data",
+        verbose_name=_("Region"),
+        help_text=_("The region this sales data is attributed to, if any."),
+        db_comment="Optional foreign key to the Region model.",
+    )
+    segment = models.ForeignKey(
+        CustomerSegment,
+        on_delete=models.PROTECT,
+        blank=True,
+        null=True,
+        related_name="sales_data",
+        verbose_name=_("Customer Segment"),
+        help_text=_("The customer segment this sales data is attributed to, if any."),
+        db_comment="Optional foreign key to the CustomerSegment model.",
+    )
+    sample_key = models.FloatField(
+        default=random_sample_key,
+        editable=False,
+        db_index=True,
+        verbose_name=_("Sample Key"),
+        help_text=_("Uniform random key used to draw samples for approximate queries."),
+        db_comment="Stores a uniform random number in [0, 1) for sampling.",
+    )
 
     class Meta:
         db_table_comment = "Stores sales data for products."
         verbose_name = _("Sales Data")
         verbose_name_plural = _("Sales Data")
-        unique_together = ["product", "date", "currency"]
+        indexes = [models.Index(fields=["product", "sample_key"])]
+        constraints = [
+            # Unattributed dimensions are NULL, which never compare equal in a
+            # plain unique constraint, so they are compared as 0 instead
+            models.UniqueConstraint(
+                "product",
+                "date",
+                "currency",
+                Coalesce("channel", 0),
+                Coalesce("region", 0),
+                Coalesce("segment", 0),
+                name="unique_sales_data_per_day_and_dimensions",
+                violation_error_message=_(
+                    "Sales data already exists for this product, date, currency and dimensions."
+                ),
+            )
+        ]
 
     def __str__(self):
         return f"{self.product.name} - {self.date}"
@@ -0,0 +1,10 @@
+import random
+
+
+def random_sample_key():
+    """Return a uniform random sample key in [0, 1).
+
+    Used as the default of the `sample_key` field of sampled metric models,
+    which approximate queries filter on to draw uniform samples.
+    """
+    return random.random()
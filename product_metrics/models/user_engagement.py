@@ -1,7 +1,11 @@
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.core.validators import MinValueValidator
 from django.utils.translation import gettext_lazy as _
 from product_metrics.models.product import Product
+from product_metrics.models.sales_channel import SalesChannel
+from product_metrics.models.region import Region
+from product_metrics.models.customer_segment import CustomerSegment
 
 
 class UserEngagement(models.Model):
@@ -16,6 +20,9 @@ class UserEngagement(models.Model):
         date (date): The date of the engagement data
         active_users (int): Number of active users
         churn_rate (float): Percentage of users who stopped using the product
+        channel (SalesChannel): The optional sales channel dimension
+        region (Region): The optional region dimension
+        segment (CustomerSegment): The optional customer segment dimension
     """
 
     product = models.ForeignKey(
@@ -44,12 +51,56 @@ class UserEngagement(models.Model):
         help_text=_("The churn rate (in percentage) on this date."),
         db_comment="Stores the churn rate in percentage.",
     )
+    channel = models.ForeignKey(
+        SalesChannel,
+        on_delete=models.PROTECT,
+        blank=True,
+        null=True,
+        related_name="user_engagement",
+        verbose_name=_("Sales Channel"),
+        help_text=_("The sales channel this engagement data is attributed to, if any."),
+        db_comment="Optional foreign key to the SalesChannel model.",
+    )
+    region = models.ForeignKey(
+        Region,
+        on_delete=models.PROTECT,
+        blank=True,
+        null=True,
+        related_name="user_engagement",
+        verbose_name=_("Region"),
+        help_text=_("The region this engagement data is attributed to, if any."),
+        db_comment="Optional foreign key to the Region model.",
+    )
+    segment = models.ForeignKey(
+        CustomerSegment,
+        on_delete=models.PROTECT,
+        blank=True,
+        null=True,
+        related_name="user_engagement",
+        verbose_name=_("Customer Segment"),
+        help_text=_("The customer segment this engagement data is attributed to, if any."),
+        db_comment="Optional foreign key to the CustomerSegment model.",
+    )
 
     class Meta:
         db_table_comment = "Stores user engagement data for products."
         verbose_name = _("User Engagement")
         verbose_name_plural = _("User Engagement")
-        unique_together = ["product", "date"]
+        constraints = [
+            # Unattributed dimensions are NULL, which never compare equal in a
+            # plain unique constraint, so they are compared as 0 instead
+            models.UniqueConstraint(
+                "product",
+                "date",
+                Coalesce("channel", 0),
+                Coalesce("region", 0),
+                Coalesce("segment", 0),
+                name="unique_user_engagement_per_day_and_dimensions",
+                violation_error_message=_(
+                    "User engagement already exists for this product, date and dimensions."
+                ),
+            )
+        ]
 
     def __str__(self):
         return f"{self.product.name} - {self.date}"
@@ -1,4 +1,5 @@
 from django.contrib.auth.models import AnonymousUser
+from django.db.models import Q
 
 
 class BasePermission:
@@ -221,3 +222,89 @@ class IsSuperUser(BasePermission):
 
         """
         return self.has_permission(request, view)
+
+
+class HasProductAccess(IsAuthenticated):
+    """Allow authenticated users access to the products granted to them.
+
+    Products are granted with `ProductAccessGrant` rows, either to a user
+    directly or to one of their groups; superusers see every product. Views
+    and admins restrict their querysets with `get_queryset_filter`, which
+    resolves the grants in SQL through one indexed subquery, so rows of
+    other products are never loaded. The set of granted product ids is
+    cached on the request for object-level checks.
+
+    """
+
+    cache_attribute = "_product_metrics_granted_ids"
+
+    def get_grants(self, request):
+        """Return the grants of the request user and their groups.
+
+        Args:
+            request: The Django HTTP request object.
+
+        Returns:
+            QuerySet: The `ProductAccessGrant` rows applying to the user.
+
+        """
+        from product_metrics.models import ProductAccessGrant
+
+        return ProductAccessGrant.objects.filter(
+            Q(user=request.user) | Q(group__user=request.user)
+        )
+
+    def get_granted_product_ids(self, request):
+        """Return the ids of the products granted to the request user.
+
+        The set is evaluated once per request and cached on it.
+
+        Args:
+            request: The Django HTTP request object.
+
+        Returns:
+            frozenset: The granted product ids.
+
+        """
+        if not hasattr(request, self.cache_attribute):
+            product_ids = self.get_grants(request).values_list("product_id", flat=True)
+            setattr(request, self.cache_attribute, frozenset(product_ids))
+        return getattr(request, self.cache_attribute)
+
+    def get_queryset_filter(self, request, view, field="pk"):
+        """Return the filter restricting a queryset to the granted products.
+
+        Args:
+            request: The Django HTTP request object.
+            view: The Django view instance being accessed.
+            field: The lookup of the product id on the filtered model, e.g.
+                `pk` for products or `product` for metric rows.
+
+        Returns:
+            Q: The filter to apply; empty for superusers.
+
+        """
+        if not self.has_permission(request, view):
+            return Q(pk__in=[])
+        if request.user.is_superuser:
+            return Q()
+        return Q(**{f"{field}__in": self.get_grants(request).values("product_id")})
+
+    def has_object_permission(self, request, view, obj):
+        """Check if the product of an object is granted to the user.
+
+        Args:
+            request: The Django HTTP request object.
+            view: The Django view instance being accessed.
+            obj: A product, or an object with a `product_id`.
+
+        Returns:
+            bool: True if the user may access the object's product.
+
+        """
+        if not self.has_permission(request, view):
+            return False
+        if request.user.is_superuser:
+            return True
+        product_id = getattr(obj, "product_id", obj.pk)
+        return product_id in self.get_granted_product_ids(request)
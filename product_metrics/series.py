@@ -0,0 +1,74 @@
+"""Columnar fetching of date-ordered metric series for charts.
+
+Chart series are read with `values_list` over a chunked (server-side where
+the database supports it) cursor and appended to typed `array` columns, so
+no model instances or per-row Python lists are built. Dates are stored as
+days since the Unix epoch and the columns are serialized as one JSON object
+per chart, which the browser turns into date labels.
+"""
+
+import json
+from array import array
+from datetime import date
+from typing import NamedTuple
+
+CHUNK_SIZE = 2000
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class Series(NamedTuple):
+    """A date-ordered series stored as typed columns.
+
+    `dates` holds the days since the Unix epoch and `columns` maps each
+    value field to an `array` of the same length.
+
+    """
+
+    dates: array
+    columns: dict
+
+    @property
+    def last_date(self):
+        """Return the last date of the series, or None if it is empty."""
+        if not self.dates:
+            return None
+        return date.fromordinal(self.dates[-1] + EPOCH_ORDINAL)
+
+    def to_json(self):
+        """Serialize the series as a JSON object of `dates` and the columns."""
+        return json.dumps(
+            {
+                "dates": self.dates.tolist(),
+                **{field: column.tolist() for field, column in self.columns.items()},
+            }
+        )
+
+
+def fetch_series(queryset, date_field="date", chunk_size=CHUNK_SIZE, **fields):
+    """Stream a queryset into a date-ordered columnar series.
+
+    Args:
+        queryset: The queryset to read; it may be an aggregate grouped by
+            `date_field` and the value fields may be annotations.
+        date_field: The date field of the series.
+        chunk_size: The number of rows fetched per round trip of the cursor.
+        **fields: The value fields mapped to the `array` typecode storing
+            them, e.g. `revenue="d"` or `units_sold="q"`.
+
+    Returns:
+        Series: The fetched series, ordered by date.
+
+    """
+    dates = array("l")
+    columns = {field: array(typecode) for field, typecode in fields.items()}
+    appends = [column.append for column in columns.values()]
+    rows = (
+        queryset.order_by(date_field)
+        .values_list(date_field, *fields)
+        .iterator(chunk_size=chunk_size)
+    )
+    for day, *values in rows:
+        dates.append(day.toordinal() - EPOCH_ORDINAL)
+        for append, value in zip(appends, values):
+            append(value)
+    return Series(dates, columns)
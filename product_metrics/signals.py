@@ -0,0 +1,79 @@
+from django.db.models import Avg, Count
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from product_metrics.comparisons import KPI_FAMILIES
+from product_metrics.models import (
+    CustomerFeedback,
+    MetricChange,
+    SalesData,
+    UserEngagement,
+)
+
+
+def _daily_totals(model, instance, aggregates):
+    """Aggregate the rows of the saved instance's product and day.
+
+    Rows of a day may be split by currency and dimensions, so the change
+    log carries the daily totals rather than the values of a single row.
+
+    """
+    totals = model.objects.filter(
+        product_id=instance.product_id, date=instance.date
+    ).aggregate(**aggregates)
+    return {
+        metric: None if value is None else float(value)
+        for metric, value in totals.items()
+    }
+
+
+@receiver(post_save, sender=SalesData)
+def record_sales_data_change(sender, instance, **kwargs):
+    """Append the sales totals of the saved day to the change log."""
+    values = _daily_totals(SalesData, instance, KPI_FAMILIES["sales_data"][1])
+    MetricChange.objects.create(
+        product_id=instance.product_id,
+        source=MetricChange.Source.SALES_DATA,
+        date=instance.date,
+        values={
+            "revenue": values["revenue"],
+            "units_sold": int(values["units_sold"] or 0),
+        },
+    )
+
+
+@receiver(post_save, sender=UserEngagement)
+def record_user_engagement_change(sender, instance, **kwargs):
+    """Append the engagement totals of the saved day to the change log."""
+    values = _daily_totals(
+        UserEngagement, instance, KPI_FAMILIES["user_engagement"][1]
+    )
+    MetricChange.objects.create(
+        product_id=instance.product_id,
+        source=MetricChange.Source.USER_ENGAGEMENT,
+        date=instance.date,
+        values={
+            "active_users": int(values["active_users"] or 0),
+            "churn_rate": round(values["churn_rate"] or 0, 2),
+        },
+    )
+
+
+@receiver(post_save, sender=CustomerFeedback)
+def record_customer_feedback_change(sender, instance, **kwargs):
+    """Append the feedback aggregates of the saved day and product to the
+    change log."""
+    values = _daily_totals(
+        CustomerFeedback,
+        instance,
+        {"feedback_count": Count("id"), "average_rating": Avg("rating")},
+    )
+    MetricChange.objects.create(
+        product_id=instance.product_id,
+        source=MetricChange.Source.CUSTOMER_FEEDBACK,
+        date=instance.date,
+        values={
+            "feedback_count": int(values["feedback_count"]),
+            "average_rating": values["average_rating"],
+        },
+    )
@@ -0,0 +1,43 @@
+"""Built-in tasks of the metrics job runner."""
+
+from product_metrics.anomalies import scan_anomalies
+from product_metrics.approximate import reset_sample_keys
+from product_metrics.cube import materialize_cube, refresh_recent_cube
+from product_metrics.events import RETENTION_DAYS, prune_changes
+from product_metrics.jobs import register
+
+
+@register("refresh_forecasts")
+def refresh_forecasts_task(full=False):
+    """Refresh the stored forecasts of all products."""
+    # NumPy is only required by workers that run this task
+    from product_metrics.forecasting import refresh_forecasts
+
+    refresh_forecasts(full=full)
+
+
+@register("scan_anomalies")
+def scan_anomalies_task():
+    """Scan the metric days newer than the stored watermarks for anomalies."""
+    scan_anomalies()
+
+
+@register("reset_sample_keys")
+def reset_sample_keys_task():
+    """Redraw the sample keys used by approximate queries."""
+    reset_sample_keys()
+
+
+@register("prune_metric_changes")
+def prune_metric_changes_task(days=RETENTION_DAYS):
+    """Delete old entries of the metric change log."""
+    prune_changes(days=days)
+
+
+@register("materialize_cube")
+def materialize_cube_task(days=None):
+    """Rebuild the metric cube, or only its cells of the last `days` days."""
+    if days:
+        refresh_recent_cube(days)
+    else:
+        materialize_cube()
@@ -1,10 +1,22 @@
 from django.urls import path
 
-from product_metrics.views import ProductMetricsListView, ProductMetricsDetailView
+from product_metrics.views import (
+    ProductMetricsListView,
+    ProductMetricsDetailView,
+    ProductMetricsKPIView,
+    ProductMetricsBreakdownView,
+    ProductMetricsAnomalyFeedView,
+    ProductMetricsEventStreamView,
+)
 
 app_name = "product_metrics"
 
 urlpatterns = [
     path("", ProductMetricsListView.as_view(), name="product_metrics_list"),
     path("<int:product_id>/", ProductMetricsDetailView.as_view(), name="product_metrics_detail"),
+    path("<int:product_id>/breakdown/", ProductMetricsBreakdownView.as_view(), name="product_metrics_breakdown"),
+    path("kpis/", ProductMetricsKPIView.as_view(), name="product_metrics_kpis"),
+    path("anomalies/", ProductMetricsAnomalyFeedView.as_view(), name="product_metrics_anomalies"),
+    path("events/", ProductMetricsEventStreamView.as_view(), name="product_metrics_events"),
+    path("<int:product_id>/events/", ProductMetricsEventStreamView.as_view(), name="product_metrics_detail_events"),
 ]
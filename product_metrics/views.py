@@ -1,10 +1,46 @@
+import math
+import operator
+from datetime import date
+
+from asgiref.sync import sync_to_async
 from django.core.exceptions import PermissionDenied
-from django.db.models import Count, Avg
-from django.views.generic import ListView, DetailView
-from product_metrics.models import Product, SalesData, UserEngagement, CustomerFeedback
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Avg, Case, Count, Q, When
+from django.db.models.functions import Abs
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.views.generic import ListView, DetailView, View
+from product_metrics.models import (
+    Product,
+    SalesData,
+    UserEngagement,
+    CustomerFeedback,
+    ProductForecast,
+    MetricAnomaly,
+)
+from product_metrics.approximate import (
+    DEFAULT_SAMPLE_FRACTION,
+    MIN_SAMPLE_FRACTION,
+    approximate_aggregate,
+)
+from product_metrics.cube import DIMENSIONS, dimension_names, query_cube
+from product_metrics.comparisons import (
+    COMPARISON_PERIODS,
+    DEFAULT_COMPARISON_PERIOD,
+    KPI_FAMILIES,
+    fetch_kpi_comparisons,
+)
+from product_metrics.events import stream_changes
+from product_metrics.measures import REPORTING_CURRENCY
+from product_metrics.series import fetch_series
 from product_metrics.settings.conf import config
 
 
+def _estimate_json(estimate):
+    """Return a JSON-serializable representation of an `Estimate`."""
+    return estimate._asdict() if estimate else None
+
+
 class BaseView:
     """Base view class for views that handles common authentication logic."""
 
@@ -22,110 +58,503 @@ class BaseView:
             ) or not permission.has_permission(request, self):
                 raise PermissionDenied()
 
+    def check_object_permissions(self, request, obj):
+        """Check if the request may access an object, raising Http404 if not.
+
+        Inaccessible objects are reported as missing, so their ids do not
+        reveal which objects exist.
+
+        """
+        for permission in self.get_permissions():
+            if not permission.has_object_permission(request, self, obj):
+                raise Http404()
+
+    def get_queryset_filter(self, field="pk"):
+        """Return the product access filter of the view's permissions.
+
+        Args:
+            field: The lookup of the product id on the filtered model.
+
+        Returns:
+            Q: The combined filter of every permission defining
+            `get_queryset_filter`; empty when none restricts access.
+
+        """
+        condition = Q()
+        for permission in self.get_permissions():
+            if hasattr(permission, "get_queryset_filter"):
+                condition &= permission.get_queryset_filter(self.request, self, field)
+        return condition
+
+    def filter_queryset(self, queryset, field="pk"):
+        """Restrict a queryset to the products the request user may access."""
+        return queryset.filter(self.get_queryset_filter(field))
+
     def dispatch(self, request, *args, **kwargs):
         """Handle request dispatch with permission checks."""
         self.check_permissions(request)
         return super().dispatch(request, *args, **kwargs)
 
 
-class ProductMetricsListView(BaseView, ListView):
+class ApproximateQueryMixin:
+    """Mixin enabling the opt-in approximate query mode of a view.
+
+    Approximate mode is requested with `approx=1` and answers aggregates
+    from a uniform sample of the fraction given by `sample`. Any other
+    request computes exact values.
+
+    """
+
+    def get_sample_fraction(self):
+        """Return the requested sampling fraction, or 1 for exact results."""
+        if self.request.GET.get("approx") not in ("1", "true"):
+            return 1
+        try:
+            fraction = float(self.request.GET.get("sample", DEFAULT_SAMPLE_FRACTION))
+        except ValueError:
+            fraction = DEFAULT_SAMPLE_FRACTION
+        if not math.isfinite(fraction):
+            fraction = DEFAULT_SAMPLE_FRACTION
+        return min(max(fraction, MIN_SAMPLE_FRACTION), 1)
+
+    def get_query_mode_context(self, fraction):
+        """Return the template context describing the query mode."""
+        return {
+            "is_approximate": fraction < 1,
+            "sample_fraction": fraction,
+            "sample_percent": fraction * 100,
+        }
+
+
+class BreakdownMixin:
+    """Mixin answering dimensional breakdowns of a product's metrics.
+
+    The breakdown groups by the comma-separated dimensions of the
+    `group_by` query parameter, can be sliced with one query parameter per
+    dimension holding a dimension id (or `none` for unattributed rows) and
+    limited with the `start` and `end` dates (YYYY-MM-DD).
+
+    """
+
+    def get_breakdown(self, product):
+        """Return the grouped dimensions and rows of the requested breakdown.
+
+        Raises:
+            ValueError: If a query parameter is invalid.
+
+        """
+        params = self.request.GET
+        group_by = [field for field in params.get("group_by", "").split(",") if field]
+        dimension_filters = {
+            dimension: None if params[dimension] == "none" else int(params[dimension])
+            for dimension in DIMENSIONS
+            if params.get(dimension)
+        }
+        start = date.fromisoformat(params["start"]) if params.get("start") else None
+        end = date.fromisoformat(params["end"]) if params.get("end") else None
+
+        rows = query_cube(
+            group_by, [product.pk], start=start, end=end, **dimension_filters
+        )
+        names = dimension_names(rows, group_by)
+        for row in rows:
+            for dimension, names_by_id in names.items():
+                row[dimension] = names_by_id.get(row[f"{dimension}_id"])
+            row["labels"] = [
+                row[field] if field in names or field == "date" else row[f"{field}_id"]
+                for field in group_by
+            ]
+        return group_by, rows
+
+
+class ProductKPIMixin:
+    """Mixin building the latest KPIs of products with period-over-period
+    comparisons.
+
+    The comparison period is read from the `compare` query parameter and
+    falls back to `DEFAULT_COMPARISON_PERIOD`.
+
+    """
+
+    def get_comparison_period(self):
+        """Return the comparison period requested by the client."""
+        period = self.request.GET.get("compare", DEFAULT_COMPARISON_PERIOD)
+        return period if period in COMPARISON_PERIODS else DEFAULT_COMPARISON_PERIOD
+
+    def get_product_kpis(self, products, period, fraction=1):
+        """Return the KPI data of every product.
+
+        The queries issued do not depend on the number of products: the
+        latest and comparison values of each metric family are fetched for
+        all products at once, as are the feedback statistics. The feedback
+        statistics are estimated from a sample when `fraction` is below 1.
+
+        """
+        product_ids = [product.pk for product in products]
+        comparisons = fetch_kpi_comparisons(product_ids, period)
+        feedback_stats = approximate_aggregate(
+            CustomerFeedback.objects.filter(product_id__in=product_ids),
+            "rating",
+            fraction,
+            group_by="product_id",
+        )
+
+        product_kpis = []
+        for product in products:
+            kpis = comparisons[product.pk]
+            sales = kpis.get("revenue", {})
+            engagement = kpis.get("active_users", {})
+            stats = feedback_stats.get(product.pk)
+            product_kpis.append(
+                {
+                    "product": product,
+                    "latest_sales_date": sales.get("date"),
+                    "latest_engagement_date": engagement.get("date"),
+                    "latest_revenue": sales.get("value") or 0,
+                    "latest_units_sold": int(kpis.get("units_sold", {}).get("value") or 0),
+                    "active_users": int(engagement.get("value") or 0),
+                    "churn_rate": round(kpis.get("churn_rate", {}).get("value") or 0, 2),
+                    "average_rating": stats["avg"].value if stats else 0,
+                    "average_rating_estimate": stats["avg"] if stats else None,
+                    "total_feedback": round(stats["count"].value) if stats else 0,
+                    "total_feedback_estimate": stats["count"] if stats else None,
+                    "comparisons": kpis,
+                }
+            )
+        return product_kpis
+
+
+class ProductMetricsListView(BaseView, ApproximateQueryMixin, ProductKPIMixin, ListView):
     """View for displaying a list of products with their key metrics."""
 
     template_name = "product_metrics_list.html"
     model = Product
     context_object_name = "products"
 
+    def get_queryset(self):
+        """Return the products the request user may access."""
+        return self.filter_queryset(super().get_queryset())
+
     def get_context_data(self, **kwargs):
         """Get the context data for the template."""
         context = super().get_context_data(**kwargs)
-        context["products"] = []
-
-        for product in self.get_queryset():
-            # Get latest sales data
-            latest_sales = (
-                SalesData.objects.filter(product=product).order_by("-date").first()
-            )
-
-            # Get latest engagement data
-            latest_engagement = (
-                UserEngagement.objects.filter(product=product).order_by("-date").first()
-            )
-
-            # Get aggregated feedback data
-            feedback_stats = CustomerFeedback.objects.filter(product=product).aggregate(
-                avg_rating=Avg("rating"), total_feedback=Count("id")
-            )
+        period = self.get_comparison_period()
+        fraction = self.get_sample_fraction()
+        context.update(self.get_query_mode_context(fraction))
+        context["comparison_period"] = period
+        context["comparison_periods"] = COMPARISON_PERIODS
+        context["reporting_currency"] = REPORTING_CURRENCY
+        context["products"] = self.get_product_kpis(
+            list(self.object_list), period, fraction
+        )
+        return context
 
-            product_data = {
-                "product": product,
-                "latest_revenue": latest_sales.revenue if latest_sales else 0,
-                "latest_units_sold": latest_sales.units_sold if latest_sales else 0,
-                "active_users": (
-                    latest_engagement.active_users if latest_engagement else 0
-                ),
-                "churn_rate": (
-                    round(latest_engagement.churn_rate, 2) if latest_engagement else 0
-                ),
-                "average_rating": feedback_stats["avg_rating"] or 0,
-                "total_feedback": feedback_stats["total_feedback"] or 0,
-            }
-            context["products"].append(product_data)
 
-        return context
+class ProductMetricsDetailView(BaseView, ProductKPIMixin, BreakdownMixin, DetailView):
+    """View for displaying detailed metrics for a specific product.
 
+    The lifetime totals are derived from the full daily series fetched for
+    the charts, so they are always exact and cost no further queries.
 
-class ProductMetricsDetailView(BaseView, DetailView):
-    """View for displaying detailed metrics for a specific product."""
+    """
 
     template_name = "product_metrics_detail.html"
     model = Product
     context_object_name = "product"
     pk_url_kwarg = "product_id"
 
+    def get_object(self, queryset=None):
+        """Return the product, checking that the request user may access it."""
+        product = super().get_object(queryset)
+        self.check_object_permissions(self.request, product)
+        return product
+
+    def get_forecast_series(self, product, metric, after=None):
+        """Return the stored forecast of a metric as a columnar series.
+
+        Forecasts are appended to the observed series on the chart axis, so
+        stale forecasts of dates that have already been observed are left
+        out.
+
+        Args:
+            product: The product being displayed.
+            metric: The `ProductForecast.Metric` to overlay.
+            after: The last observed date of the metric, if any.
+
+        Returns:
+            Series: The forecasted dates and their `value` column.
+
+        """
+        forecasts = ProductForecast.objects.filter(product=product, metric=metric)
+        if after is not None:
+            forecasts = forecasts.filter(date__gt=after)
+        return fetch_series(forecasts, value="d")
+
     def get_context_data(self, **kwargs):
         """Get the context data for the template."""
         context = super().get_context_data(**kwargs)
-        product = self.get_object()
+        product = self.object
 
-        # Fetch sales data
-        sales_data = SalesData.objects.filter(product=product).order_by("date")
-        sales_labels = [data.date.strftime("%Y-%m-%d") for data in sales_data]
-        sales_revenue = [float(data.revenue) for data in sales_data]
-        sales_units_sold = [data.units_sold for data in sales_data]
-
-        # Fetch user engagement data
-        engagement_data = UserEngagement.objects.filter(product=product).order_by(
-            "date"
+        # Fetch the daily totals of the chart series as typed columns, using
+        # the KPI aggregates as a day may be split by currency and dimension
+        sales_series = fetch_series(
+            SalesData.objects.filter(product=product)
+            .values("date")
+            .annotate(**KPI_FAMILIES["sales_data"][1]),
+            revenue="d",
+            units_sold="q",
         )
-        engagement_labels = [data.date.strftime("%Y-%m-%d") for data in engagement_data]
-        active_users = [data.active_users for data in engagement_data]
-        churn_rate = [round(data.churn_rate, 2) for data in engagement_data]
-
-        # Fetch aggregated customer feedback data
-        feedback_aggregated = (
+        engagement_series = fetch_series(
+            UserEngagement.objects.filter(product=product)
+            .values("date")
+            .annotate(**KPI_FAMILIES["user_engagement"][1]),
+            active_users="q",
+            churn_rate="d",
+        )
+        feedback_series = fetch_series(
             CustomerFeedback.objects.filter(product=product)
             .values("date")
-            .annotate(feedback_count=Count("id"), average_rating=Avg("rating"))
-            .order_by("date")
+            .annotate(feedback_count=Count("id"), average_rating=Avg("rating")),
+            feedback_count="q",
+            average_rating="d",
+        )
+
+        # Overlay stored forecasts on the sales and engagement charts
+        revenue_forecast = self.get_forecast_series(
+            product, ProductForecast.Metric.REVENUE, sales_series.last_date
+        )
+        active_users_forecast = self.get_forecast_series(
+            product, ProductForecast.Metric.ACTIVE_USERS, engagement_series.last_date
+        )
+
+        # Compare the latest KPIs with the requested prior period
+        period = self.get_comparison_period()
+        comparisons = fetch_kpi_comparisons([product.pk], period)[product.pk]
+
+        # Lifetime totals, summed from the daily series
+        feedback_counts = feedback_series.columns["feedback_count"]
+        feedback_count = sum(feedback_counts)
+        rating_total = sum(
+            map(operator.mul, feedback_counts, feedback_series.columns["average_rating"])
+        )
+        totals = {
+            "revenue": sum(sales_series.columns["revenue"]),
+            "units_sold": sum(sales_series.columns["units_sold"]),
+            "average_rating": rating_total / feedback_count if feedback_count else 0,
+            "feedback_count": feedback_count,
+        }
+
+        # Dimensional breakdown, answered from the metric cube when requested
+        breakdown_dimensions, breakdown = [], []
+        if "group_by" in self.request.GET:
+            try:
+                breakdown_dimensions, breakdown = self.get_breakdown(product)
+            except ValueError:
+                pass
+        context.update(
+            {
+                "dimensions": list(DIMENSIONS),
+                "breakdown_dimensions": breakdown_dimensions,
+                "breakdown": breakdown if breakdown_dimensions else [],
+            }
         )
-        feedback_labels = [
-            entry["date"].strftime("%Y-%m-%d") for entry in feedback_aggregated
-        ]
-        feedback_counts = [entry["feedback_count"] for entry in feedback_aggregated]
-        average_ratings = [entry["average_rating"] for entry in feedback_aggregated]
 
         context.update(
             {
-                "sales_labels": sales_labels,
-                "sales_revenue": sales_revenue,
-                "sales_units_sold": sales_units_sold,
-                "engagement_labels": engagement_labels,
-                "active_users": active_users,
-                "churn_rate": churn_rate,
-                "feedback_labels": feedback_labels,
-                "feedback_counts": feedback_counts,
-                "average_ratings": average_ratings,
+                "totals": totals,
+                "comparison_period": period,
+                "comparison_periods": COMPARISON_PERIODS,
+                "comparisons": comparisons,
+                "reporting_currency": REPORTING_CURRENCY,
+                "sales_series": sales_series,
+                "revenue_forecast": revenue_forecast,
+                "engagement_series": engagement_series,
+                "active_users_forecast": active_users_forecast,
+                "feedback_series": feedback_series,
             }
         )
 
         return context
+
+
+class ProductMetricsKPIView(BaseView, ApproximateQueryMixin, ProductKPIMixin, View):
+    """View returning the latest KPIs of all products as JSON.
+
+    Each product carries the period-over-period comparisons of its KPIs for
+    the period given by the `compare` query parameter, and the feedback
+    estimates of the requested query mode.
+
+    """
+
+    def get(self, request, *args, **kwargs):
+        """Return the KPIs of every product."""
+        period = self.get_comparison_period()
+        fraction = self.get_sample_fraction()
+        products = self.get_product_kpis(
+            list(self.filter_queryset(Product.objects.order_by("pk"))), period, fraction
+        )
+        return JsonResponse(
+            {
+                "comparison_period": period,
+                "reporting_currency": REPORTING_CURRENCY,
+                "sample_fraction": fraction,
+                "products": [
+                    {
+                        **product_kpis,
+                        "product": {
+                            "id": product_kpis["product"].pk,
+                            "name": product_kpis["product"].name,
+                        },
+                        "average_rating_estimate": _estimate_json(
+                            product_kpis["average_rating_estimate"]
+                        ),
+                        "total_feedback_estimate": _estimate_json(
+                            product_kpis["total_feedback_estimate"]
+                        ),
+                    }
+                    for product_kpis in products
+                ],
+            },
+            encoder=DjangoJSONEncoder,
+        )
+
+
+class ProductMetricsBreakdownView(BaseView, BreakdownMixin, View):
+    """View returning a dimensional breakdown of a product's metrics as
+    JSON."""
+
+    def get(self, request, *args, **kwargs):
+        """Return the breakdown rows of the product."""
+        product = get_object_or_404(Product, pk=kwargs["product_id"])
+        self.check_object_permissions(request, product)
+        try:
+            group_by, rows = self.get_breakdown(product)
+        except ValueError:
+            return JsonResponse({"error": "Invalid query parameter."}, status=400)
+        return JsonResponse(
+            {
+                "group_by": group_by,
+                "reporting_currency": REPORTING_CURRENCY,
+                "rows": rows,
+            },
+            encoder=DjangoJSONEncoder
+        )
+
+
+class ProductMetricsAnomalyFeedView(BaseView, View):
+    """View returning the most recent metric anomalies as a JSON feed.
+
+    The feed can be narrowed with the `product`, `severity` and `since`
+    (YYYY-MM-DD) query parameters and is capped by `limit`. Anomalies of
+    the same day are ordered by severity, then by the absolute z-score, so
+    drops rank alongside spikes.
+
+    """
+
+    default_limit = 100
+    max_limit = 500
+
+    def get(self, request, *args, **kwargs):
+        """Return the filtered anomalies, newest first."""
+        anomalies = self.filter_queryset(
+            MetricAnomaly.objects.select_related("product").order_by(
+                "-date",
+                Case(
+                    When(severity=MetricAnomaly.Severity.CRITICAL, then=0),
+                    default=1,
+                ),
+                Abs("z_score").desc(),
+            ),
+            field="product",
+        )
+        try:
+            if request.GET.get("product"):
+                anomalies = anomalies.filter(product_id=int(request.GET["product"]))
+            if request.GET.get("since"):
+                anomalies = anomalies.filter(
+                    date__gte=date.fromisoformat(request.GET["since"])
+                )
+            limit = min(int(request.GET.get("limit", self.default_limit)), self.max_limit)
+        except ValueError:
+            return JsonResponse({"error": "Invalid query parameter."}, status=400)
+        if request.GET.get("severity"):
+            anomalies = anomalies.filter(severity=request.GET["severity"])
+
+        return JsonResponse(
+            {
+                "anomalies": [
+                    {
+                        "product_id": anomaly.product_id,
+                        "product": anomaly.product.name,
+                        "metric": anomaly.metric,
+                        "date": anomaly.date.isoformat(),
+                        "value": anomaly.value,
+                        "expected": anomaly.expected,
+                        "z_score": round(anomaly.z_score, 2),
+                        "severity": anomaly.severity,
+                    }
+                    for anomaly in anomalies[: max(limit, 0)]
+                ]
+            }
+        )
+
+
+class ProductMetricsEventStreamView(BaseView, View):
+    """Server-Sent Events stream of changed metric values.
+
+    Streams the metric change log of all products, or of a single product
+    when `product_id` is given. Clients resume after a reconnect through the
+    `Last-Event-ID` header (or the `last_event_id` query parameter). The
+    view is asynchronous so that idle connections do not hold a worker
+    thread when served by an ASGI server.
+
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        """Handle request dispatch with permission checks run off the event
+        loop."""
+        await sync_to_async(self.check_permissions)(request)
+        return await View.dispatch(self, request, *args, **kwargs)
+
+    def get_last_event_id(self, request):
+        """Return the id of the last event received by the client, if any."""
+        last_event_id = request.headers.get(
+            "Last-Event-ID", request.GET.get("last_event_id")
+        )
+        try:
+            return int(last_event_id) if last_event_id else None
+        except ValueError:
+            return None
+
+    def get_product_ids(self, product_id=None):
+        """Return the ids of the products to stream, or None for all products.
+
+        Args:
+            product_id: The id of the single product to stream, if given.
+
+        Raises:
+            Http404: If the product does not exist or is not accessible.
+
+        """
+        if product_id:
+            product = get_object_or_404(Product, pk=product_id)
+            self.check_object_permissions(self.request, product)
+            return {product_id}
+        condition = self.get_queryset_filter()
+        if not condition:
+            return None
+        return set(Product.objects.filter(condition).values_list("pk", flat=True))
+
+    async def get(self, request, *args, **kwargs):
+        """Open the event stream."""
+        product_ids = await sync_to_async(self.get_product_ids)(kwargs.get("product_id"))
+        response = StreamingHttpResponse(
+            stream_changes(
+                last_event_id=self.get_last_event_id(request),
+                product_ids=product_ids,
+            ),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response